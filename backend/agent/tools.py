@@ -4,6 +4,8 @@ AI Agent tools for Congress data queries.
 
 from typing import Any
 
+import msgspec
+
 # Tool definitions for Claude API
 TOOLS = [
     {
@@ -107,7 +109,7 @@ async def execute_tool(tool_name: str, tool_input: dict[str, Any]) -> dict[str,
         )
         result = await MemberService.search_members(params)
         return {
-            "members": result.results,
+            "members": msgspec.to_builtins(result.results),
             "total": result.total,
             "message": f"Found {result.total} members matching your criteria.",
         }
@@ -217,6 +217,7 @@ class BillService:
 
             synced_count = 0
 
+            candidates = []
             for bill_item in bills_list:
                 bill = bill_item.get("bill", bill_item)
                 bill_type = bill.get("type", "").lower()
@@ -226,17 +227,24 @@ class BillService:
                 if not bill_type or not bill_number:
                     continue
 
-                # Check if already exists
                 bill_id = f"{bill_type}{bill_number}-{bill_congress}"
-                existing = await collection.find_one({"bill_id": bill_id})
-
-                if existing:
-                    # Skip if recently updated (within 1 hour)
-                    updated_at = existing.get("updated_at")
-                    if updated_at and datetime.utcnow() - updated_at < timedelta(
-                        hours=1
-                    ):
-                        continue
+                candidates.append((bill_id, bill_type, bill_number, bill_congress))
+
+            # Look up existing bills in one $in query rather than a find_one
+            # per bill; keep it batched when adding per-bill checks here
+            updated_at_by_id = {
+                doc["bill_id"]: doc.get("updated_at")
+                for doc in await collection.find(
+                    {"bill_id": {"$in": [c[0] for c in candidates]}},
+                    {"_id": 0, "bill_id": 1, "updated_at": 1},
+                ).to_list(length=None)
+            }
+
+            for bill_id, bill_type, bill_number, bill_congress in candidates:
+                # Skip if recently updated (within 1 hour)
+                updated_at = updated_at_by_id.get(bill_id)
+                if updated_at and datetime.utcnow() - updated_at < timedelta(hours=1):
+                    continue
 
                 # Fetch complete bill data
                 complete_bill = await BillService.fetch_bill_complete(
@@ -263,6 +271,47 @@ class BillService:
             logger.error(f"Error syncing bills from Congress {congress}: {e}")
             return 0
 
+    @staticmethod
+    async def _run_bill_search(
+        collection, mongo_query: dict, by_text_score: bool, skip: int, limit: int
+    ) -> tuple[list[dict], int]:
+        """
+        Fetch one page of bills and the total match count.
+
+        Both come from a single $facet aggregation, so the filter (including
+        any $text search) is evaluated once instead of by count_documents
+        plus find.
+
+        Returns:
+            (results, total)
+        """
+        # Text searches rank by relevance, otherwise newest first
+        if by_text_score:
+            sort = {"score": {"$meta": "textScore"}}
+        else:
+            sort = {"introduced_date": -1}
+
+        pipeline = [
+            {"$match": mongo_query},
+            {
+                "$facet": {
+                    "results": [
+                        {"$sort": sort},
+                        {"$skip": skip},
+                        {"$limit": limit},
+                        {"$project": {"_id": 0}},
+                    ],
+                    "total": [{"$count": "n"}],
+                }
+            },
+        ]
+        facets = await collection.aggregate(pipeline).to_list(length=1)
+        if not facets:
+            return [], 0
+        doc = facets[0]
+        total = doc["total"][0]["n"] if doc["total"] else 0
+        return doc["results"], total
+
     @staticmethod
     async def search_bills(
         query: Optional[str] = None,
@@ -321,9 +370,10 @@ class BillService:
             mongo_query["sponsor_id"] = {"$in": party_member_ids}
 
         # Execute initial search
-        total = await collection.count_documents(mongo_query)
         skip = (page - 1) * page_size
-        total_pages = max(1, (total + page_size - 1) // page_size)
+        results, total = await BillService._run_bill_search(
+            collection, mongo_query, bool(query), skip, page_size
+        )
 
         # Check if we need to sync more data
         target_congress = congress or 119  # Default to current congress
@@ -333,34 +383,12 @@ class BillService:
             )
             await BillService.sync_recent_bills(target_congress)
 
-            # Re-count after sync
-            total = await collection.count_documents(mongo_query)
-            total_pages = max(1, (total + page_size - 1) // page_size)
-
-        # Fetch results with projection for text score if needed
-        if query:
-            # Include text score in projection for sorting
-            projection = {"score": {"$meta": "textScore"}}
-            cursor = (
-                collection.find(mongo_query, projection)
-                .sort([("score", {"$meta": "textScore"})])
-                .skip(skip)
-                .limit(page_size)
-            )
-        else:
-            # Sort by introduced date
-            cursor = (
-                collection.find(mongo_query)
-                .sort("introduced_date", -1)
-                .skip(skip)
-                .limit(page_size)
+            # Re-run search after sync
+            results, total = await BillService._run_bill_search(
+                collection, mongo_query, bool(query), skip, page_size
             )
 
-        results = []
-        async for doc in cursor:
-            doc.pop("_id", None)
-            doc.pop("score", None)  # Remove text search score from results
-            results.append(doc)
+        total_pages = max(1, (total + page_size - 1) // page_size)
 
         return {
             "results": results,
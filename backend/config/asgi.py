@@ -11,3 +11,14 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# There is no ORM database (DATABASES = {}; data lives in MongoDB via Motor),
+# so the ORM's per-request connection housekeeping does nothing useful. Under
+# ASGI each batch of sync signal receivers costs a sync_to_async thread hop;
+# dropping these leaves request_started with no receivers at all.
+from django.core import signals  # noqa: E402
+from django.db import close_old_connections, reset_queries  # noqa: E402
+
+signals.request_started.disconnect(reset_queries)
+signals.request_started.disconnect(close_old_connections)
+signals.request_finished.disconnect(close_old_connections)
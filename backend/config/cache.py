@@ -0,0 +1,103 @@
+"""
+Small in-process caches for quasi-static query results.
+
+Member and vote data only change when the sync commands run, so aggregate
+results can be served from memory for a short TTL instead of re-scanning
+MongoDB on every request.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class AsyncTTLCache:
+    """
+    TTL cache for results of async loaders.
+
+    Concurrent misses for the same key are coalesced behind a per-key
+    asyncio.Lock, so only one caller runs the loader (no thundering herd);
+    the lock is dropped once the fill completes. Expired entries are purged
+    whenever a value is stored, and with maxsize set the oldest entries are
+    evicted once the cache is full.
+
+    Example:
+        >>> _stats_cache = AsyncTTLCache(ttl=300)
+        >>> stats = await _stats_cache.get_or_load("stats", load_stats)
+    """
+
+    def __init__(self, ttl: float, maxsize: int | None = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def _get_fresh(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (hit, value) for a non-expired entry."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for key, calling loader() on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        hit, value = self._get_fresh(key)
+        if hit:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                hit, value = self._get_fresh(key)
+                if hit:
+                    return value
+
+                value = await loader()
+                self._entries.pop(key, None)
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._purge_expired()
+                self._evict()
+                return value
+        finally:
+            # Callers already queued on this lock still serialize on it and
+            # find the fresh entry; later misses start a new lock
+            if self._locks.get(key) is lock:
+                del self._locks[key]
+
+    def _purge_expired(self):
+        """Drop expired entries from the front of the cache."""
+        # Every entry gets the same TTL and a stored key moves to the end,
+        # so entries are in expiry order and the scan stops at the first
+        # live one
+        now = time.monotonic()
+        while self._entries:
+            key = next(iter(self._entries))
+            if self._entries[key][0] > now:
+                break
+            del self._entries[key]
+
+    def _evict(self):
+        """Drop the oldest entries beyond maxsize."""
+        if self.maxsize is None:
+            return
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, key: Hashable | None = None):
+        """Drop one entry, or everything when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -25,17 +25,21 @@ async def get_database() -> AsyncIOMotorDatabase:
 
     if _database is None:
         logger.info("Connecting to MongoDB...")
-        _client = AsyncIOMotorClient(settings.MONGODB_URI)
-        _database = _client[settings.MONGODB_DB]
+        client = AsyncIOMotorClient(settings.MONGODB_URI)
 
-        # Verify connection
+        # Verify connection before publishing it, so a failed ping doesn't
+        # leave later callers holding an unreachable database
         try:
-            await _client.admin.command("ping")
-            logger.info(f"Connected to MongoDB database: {settings.MONGODB_DB}")
+            await client.admin.command("ping")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
+            client.close()
             raise
 
+        _client = client
+        _database = client[settings.MONGODB_DB]
+        logger.info(f"Connected to MongoDB database: {settings.MONGODB_DB}")
+
     return _database
 
 
@@ -66,6 +70,21 @@ async def get_collection(name: str):
     return db[COLLECTIONS[name]]
 
 
+# Atlas Search (Lucene) index definition for member name search. Created only
+# when settings.MEMBERS_ATLAS_SEARCH_INDEX is set; self-hosted MongoDB has no
+# $search support.
+MEMBERS_ATLAS_SEARCH_DEFINITION = {
+    "mappings": {
+        "dynamic": False,
+        "fields": {
+            "first_name": [{"type": "string"}, {"type": "autocomplete"}],
+            "last_name": [{"type": "string"}, {"type": "autocomplete"}],
+            "name": {"type": "string"},
+        },
+    }
+}
+
+
 async def ensure_indexes():
     """Create indexes for all collections. Skips if indexes already exist."""
     from pymongo.errors import OperationFailure
@@ -93,7 +112,25 @@ async def ensure_indexes():
     # 1. Compound index for sorted queries (last name, first name)
     await safe_create_index(members, [("last_name", 1), ("first_name", 1)])
 
+    # Filter + sort combinations: equality on the filter field, then the
+    # (last_name, first_name) sort is served from the index (no SORT stage)
+    for filter_field in ("state", "party", "chamber"):
+        await safe_create_index(
+            members, [(filter_field, 1), ("last_name", 1), ("first_name", 1)]
+        )
+    # Chamber + state (e.g. a state's senators; MemberMatcher's per-state view)
+    await safe_create_index(
+        members, [("chamber", 1), ("state", 1), ("last_name", 1), ("first_name", 1)]
+    )
+
     # 2. Case-insensitive indexes for exact and prefix matching
+    await safe_create_index(members, "name")  # ^prefix on the full name
+    # Simple-collation first_name index: regexes can't use the collated
+    # index below, and the first_name prefix branch of the $text $or needs
+    # an index (MongoDB rejects $text next to an unindexed $or branch)
+    await safe_create_index(members, "first_name")
+    # Multikey index on the precomputed lowercase name tokens ($all lookups)
+    await safe_create_index(members, "name_tokens")
     await safe_create_index(
         members,
         "first_name",
@@ -115,6 +152,19 @@ async def ensure_indexes():
         default_language="english",
     )
 
+    # 4. Optional Atlas Search index (see MEMBERS_ATLAS_SEARCH_DEFINITION)
+    if settings.MEMBERS_ATLAS_SEARCH_INDEX:
+        try:
+            await members.create_search_index(
+                {
+                    "name": settings.MEMBERS_ATLAS_SEARCH_INDEX,
+                    "definition": MEMBERS_ATLAS_SEARCH_DEFINITION,
+                }
+            )
+        except OperationFailure as e:
+            # Already exists, or the server is not Atlas
+            logger.warning(f"Atlas Search index not created: {e}")
+
     # Bills indexes
     bills = db[COLLECTIONS["bills"]]
     await safe_create_index(bills, "bill_id", unique=True)
@@ -138,5 +188,11 @@ async def ensure_indexes():
     await safe_create_index(votes, "bill_id")
     await safe_create_index(votes, "chamber")
     await safe_create_index(votes, "date")
+    # Chamber listing, newest first: equality on chamber, then the date sort
+    # is served from the index (no in-memory SORT stage)
+    await safe_create_index(votes, [("chamber", 1), ("date", -1)])
+    # Member voting record: equality on voters, newest first, with vote_id
+    # as the keyset tiebreaker for votes on the same date
+    await safe_create_index(votes, [("voters", 1), ("date", -1), ("vote_id", -1)])
 
     logger.info("Database indexes verified")
@@ -99,6 +99,12 @@ USE_TZ = True
 # MongoDB Configuration
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_DB = os.getenv("MONGODB_DB", "gov_watchdog")
+# Atlas Search index for member name search; empty uses the regex/text path
+MEMBERS_ATLAS_SEARCH_INDEX = os.getenv("MEMBERS_ATLAS_SEARCH_INDEX", "")
+# Directory for parsed Senate vote XML (immutable once published); empty
+# disables the cache and sync_votes re-downloads every vote. Entries never
+# expire; delete the directory to force a re-download
+SENATE_XML_CACHE_DIR = os.getenv("SENATE_XML_CACHE_DIR", "")
 
 # External API Keys
 CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY", "")
@@ -0,0 +1,138 @@
+"""
+Unit tests for the in-process TTL cache in config.cache.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from config import cache as cache_module
+from config.cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    """Test AsyncTTLCache hit/miss, expiry and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_caches_loader_result(self):
+        """Second lookup should not call the loader again."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return {"total": 535}
+
+        assert await cache.get_or_load("stats", loader) == {"total": 535}
+        assert await cache.get_or_load("stats", loader) == {"total": 535}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_reload(self):
+        """Entries older than the TTL should be reloaded."""
+        cache = AsyncTTLCache(ttl=0)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return len(calls)
+
+        assert await cache.get_or_load("k", loader) == 1
+        assert await cache.get_or_load("k", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        """Concurrent callers on a cold key should share one loader call."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *[cache.get_or_load("k", loader) for _ in range(5)]
+        )
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """invalidate() should drop a single key or everything."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return len(calls)
+
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("b", loader)
+
+        cache.invalidate("a")
+        assert await cache.get_or_load("a", loader) == 3
+        assert await cache.get_or_load("b", loader) == 2
+
+        cache.invalidate()
+        assert await cache.get_or_load("b", loader) == 4
+
+    @pytest.mark.asyncio
+    async def test_maxsize_evicts_oldest(self):
+        """With maxsize set, the oldest entry should be evicted first."""
+        cache = AsyncTTLCache(ttl=60, maxsize=2)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return len(calls)
+
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("b", loader)
+        await cache.get_or_load("c", loader)
+
+        assert await cache.get_or_load("b", loader) == 2
+        assert await cache.get_or_load("c", loader) == 3
+        assert await cache.get_or_load("a", loader) == 4
+
+    @pytest.mark.asyncio
+    async def test_lock_dropped_after_fill(self):
+        """Per-key locks should not outlive the fill they guard."""
+        cache = AsyncTTLCache(ttl=60)
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        await asyncio.gather(*[cache.get_or_load(k, loader) for k in "abc"] * 3)
+        assert cache._locks == {}
+
+        async def failing_loader():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("d", failing_loader)
+        assert cache._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_purged_on_set(self, monkeypatch):
+        """Storing a value should drop entries whose TTL has passed."""
+        now = [1000.0]
+        # Only the cache's clock; the event loop keeps the real one
+        monkeypatch.setattr(
+            cache_module, "time", SimpleNamespace(monotonic=lambda: now[0])
+        )
+        cache = AsyncTTLCache(ttl=60)
+
+        async def loader():
+            return "value"
+
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("b", loader)
+        now[0] += 30
+        await cache.get_or_load("c", loader)
+        now[0] += 45
+        await cache.get_or_load("d", loader)
+
+        assert list(cache._entries) == ["c", "d"]
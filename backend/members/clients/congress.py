@@ -6,6 +6,7 @@ API Documentation: https://api.congress.gov/
 
 import asyncio
 import logging
+import re
 from functools import wraps
 from typing import Any, Optional
 
@@ -22,6 +23,25 @@ DEFAULT_TIMEOUT = 30.0
 MAX_RETRIES = 3
 BACKOFF_BASE = 1.0
 
+# Separators for name tokens ("Bennet, Michael F." -> bennet, michael, f)
+NAME_TOKEN_SPLIT = re.compile(r"[\s,.\-]+")
+
+
+def tokenize_name(*names: str) -> list[str]:
+    """
+    Split name strings into sorted, de-duplicated lowercase tokens.
+
+    Used both at ingest (the indexed ``name_tokens`` member field) and at
+    query time, so stored and searched tokens are normalized the same way.
+
+    Example:
+        >>> tokenize_name("Michael", "Bennet", "Michael F. Bennet")
+        ['bennet', 'f', 'michael']
+    """
+    return sorted(
+        {token.lower() for token in NAME_TOKEN_SPLIT.split(" ".join(names)) if token}
+    )
+
 
 def retry_on_failure(max_retries: int = MAX_RETRIES, backoff_base: float = BACKOFF_BASE):
     """Decorator for retry logic with exponential backoff."""
@@ -340,6 +360,7 @@ class CongressClient:
             "name": full_name,
             "first_name": first_name,
             "last_name": last_name,
+            "name_tokens": tokenize_name(first_name, last_name, full_name),
             "party": self._normalize_party(member.get("partyName", "")),
             "state": state,
             "district": member.get("district"),
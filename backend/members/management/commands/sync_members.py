@@ -9,12 +9,14 @@ Usage:
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from django.core.management.base import BaseCommand
+from pymongo import UpdateOne
 
 from config.database import ensure_indexes, get_collection
-from members.clients.congress import get_congress_client
+from members.clients.congress import get_congress_client, tokenize_name
+from members.services import MemberService
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,63 @@ class Command(BaseCommand):
         loop = asyncio.get_event_loop()
         loop.run_until_complete(self._sync_members(chamber, congress))
 
+    async def _backfill_updated_at(self, collection):
+        """
+        Convert datetime updated_at values to epoch seconds.
+
+        Members stored before updated_at became an int keep a BSON date
+        there. Idempotent: only date-typed values are touched, so after the
+        first run this is a no-op.
+        """
+        result = await collection.update_many(
+            {"updated_at": {"$type": "date"}},
+            [
+                {
+                    "$set": {
+                        "updated_at": {
+                            "$toLong": {"$divide": [{"$toLong": "$updated_at"}, 1000]}
+                        }
+                    }
+                }
+            ],
+        )
+        if result.modified_count:
+            self.stdout.write(
+                f"  Converted updated_at on {result.modified_count} members"
+            )
+
+    async def _backfill_name_tokens(self, collection):
+        """
+        Add the indexed name_tokens array to members stored before it existed.
+
+        Tokens are computed with tokenize_name, exactly as transform_member
+        does at ingest, so backfilled and freshly synced members match the
+        same token searches. Idempotent: only documents missing the field
+        are touched, so after the first run this is a no-op index lookup.
+        """
+        cursor = collection.find(
+            {"name_tokens": {"$exists": False}},
+            {"_id": 0, "bioguide_id": 1, "first_name": 1, "last_name": 1, "name": 1},
+        )
+        ops = [
+            UpdateOne(
+                {"bioguide_id": member["bioguide_id"]},
+                {
+                    "$set": {
+                        "name_tokens": tokenize_name(
+                            member.get("first_name") or "",
+                            member.get("last_name") or "",
+                            member.get("name") or "",
+                        )
+                    }
+                },
+            )
+            async for member in cursor
+        ]
+        if ops:
+            await collection.bulk_write(ops, ordered=False)
+            self.stdout.write(f"  Backfilled name_tokens on {len(ops)} members")
+
     async def _sync_members(self, chamber: str | None, congress: int):
         """Async method to sync members."""
         # Ensure database indexes exist
@@ -53,6 +112,8 @@ class Command(BaseCommand):
 
         client = get_congress_client()
         collection = await get_collection("members")
+        await self._backfill_updated_at(collection)
+        await self._backfill_name_tokens(collection)
 
         synced = 0
         errors = 0
@@ -83,7 +144,7 @@ class Command(BaseCommand):
                         if chamber_filter and member.get("chamber") != chamber_filter:
                             continue
 
-                        member["updated_at"] = datetime.utcnow()
+                        member["updated_at"] = int(time.time())
 
                         # Upsert into database
                         await collection.update_one(
@@ -120,6 +181,9 @@ class Command(BaseCommand):
                 errors += 1
                 break
 
+        # Drop cached stats/states aggregates held by this process
+        MemberService.invalidate_caches()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"\nSync complete! Synced {synced} members with {errors} errors."
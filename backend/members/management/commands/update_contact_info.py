@@ -11,7 +11,7 @@ Usage:
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from django.core.management.base import BaseCommand
 
@@ -85,7 +85,7 @@ class Command(BaseCommand):
                             "$set": {
                                 "phone": phone,
                                 "address": address,
-                                "updated_at": datetime.utcnow(),
+                                "updated_at": int(time.time()),
                             }
                         },
                     )
@@ -1,16 +1,38 @@
 """
 Pydantic models for Congress members.
+
+Models use ``defer_build`` so their pydantic-core schemas are built on first
+use rather than at import time, which keeps management-command and worker
+startup cheap.
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def to_epoch_seconds(value):
+    """
+    Coerce a stored updated_at to epoch seconds.
+
+    Members synced before updated_at became an int stored a datetime
+    (naive, in UTC); anything else is returned unchanged.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return value
 
 
 class Term(BaseModel):
     """A term served by a member."""
 
+    model_config = ConfigDict(defer_build=True)
+
     congress: int
     chamber: str  # "house" or "senate"
     start_year: int
@@ -36,10 +58,20 @@ class Member(BaseModel):
     phone: Optional[str] = None
     address: Optional[str] = None
     terms: list[Term] = Field(default_factory=list)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        json_schema_extra = {
+    updated_at: int = Field(
+        default_factory=lambda: int(time.time()),
+        description="Last sync time as epoch seconds (UTC)",
+    )
+
+    @field_validator("updated_at", mode="before")
+    @classmethod
+    def _coerce_legacy_updated_at(cls, value):
+        """Accept datetime updated_at values from older documents."""
+        return to_epoch_seconds(value)
+
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "bioguide_id": "P000197",
                 "name": "Nancy Pelosi",
@@ -51,12 +83,32 @@ class Member(BaseModel):
                 "chamber": "house",
                 "image_url": "https://bioguide.congress.gov/bioguide/photo/P/P000197.jpg",
             }
-        }
+        },
+    )
 
 
 class MemberSummary(BaseModel):
     """Lightweight member summary for lists."""
 
+    model_config = ConfigDict(defer_build=True)
+
+    bioguide_id: str
+    name: str
+    party: str
+    state: str
+    district: Optional[int] = None
+    chamber: str
+    image_url: Optional[str] = None
+
+
+class MemberSummaryStruct(msgspec.Struct, kw_only=True):
+    """
+    Wire-format member summary used on list endpoints.
+
+    Same fields as MemberSummary, but built without Pydantic validation and
+    encoded directly to JSON by msgspec.
+    """
+
     bioguide_id: str
     name: str
     party: str
@@ -69,6 +121,8 @@ class MemberSummary(BaseModel):
 class MemberSearchParams(BaseModel):
     """Search parameters for member queries."""
 
+    model_config = ConfigDict(defer_build=True)
+
     q: Optional[str] = Field(None, description="Search term for name")
     state: Optional[str] = Field(None, description="Filter by state code")
     party: Optional[str] = Field(None, description="Filter by party: D, R, I")
@@ -80,6 +134,8 @@ class MemberSearchParams(BaseModel):
 class PaginatedResponse(BaseModel):
     """Paginated response wrapper."""
 
+    model_config = ConfigDict(defer_build=True)
+
     results: list
     total: int
     page: int
@@ -5,6 +5,8 @@ This file demonstrates various search patterns and their expected behavior.
 Use these examples as a reference when testing or extending search functionality.
 """
 
+import asyncio
+
 from members.models import MemberSearchParams
 from members.services import MemberService
 
@@ -109,11 +111,13 @@ async def example_case_insensitive():
     """
     All searches are case-insensitive.
     """
-    # All these return the same results
-    results1 = await MemberService.search_members(MemberSearchParams(q="MIKE"))
-    results2 = await MemberService.search_members(MemberSearchParams(q="mike"))
-    results3 = await MemberService.search_members(MemberSearchParams(q="Mike"))
-    results4 = await MemberService.search_members(MemberSearchParams(q="MiKe"))
+    # All these return the same results (independent queries, issued concurrently)
+    results1, results2, results3, results4 = await asyncio.gather(
+        *[
+            MemberService.search_members(MemberSearchParams(q=q))
+            for q in ("MIKE", "mike", "Mike", "MiKe")
+        ]
+    )
 
     # All should be identical
     assert results1 == results2 == results3 == results4
@@ -179,19 +183,17 @@ async def example_multiple_filters():
     """
     Combine multiple filters for precise searching.
     """
-    # Democratic senators from California
-    results = await MemberService.search_members(
-        MemberSearchParams(state="CA", party="D", chamber="senate")
-    )
-
-    # Republican House members named Smith
-    results = await MemberService.search_members(
-        MemberSearchParams(q="Smith", party="R", chamber="house")
-    )
-
-    # Any member named Mike from Texas
-    results = await MemberService.search_members(
-        MemberSearchParams(q="Mike", state="TX")
+    ca_dem_senators, gop_house_smiths, tx_mikes = await asyncio.gather(
+        # Democratic senators from California
+        MemberService.search_members(
+            MemberSearchParams(state="CA", party="D", chamber="senate")
+        ),
+        # Republican House members named Smith
+        MemberService.search_members(
+            MemberSearchParams(q="Smith", party="R", chamber="house")
+        ),
+        # Any member named Mike from Texas
+        MemberService.search_members(MemberSearchParams(q="Mike", state="TX")),
     )
 
 
@@ -204,19 +206,19 @@ async def example_pagination():
     """
     Handle large result sets with pagination.
     """
-    # First page (default: 20 results)
-    page1 = await MemberService.search_members(
-        MemberSearchParams(q="Smith", page=1, page_size=20)
-    )
-
-    # Second page
-    page2 = await MemberService.search_members(
-        MemberSearchParams(q="Smith", page=2, page_size=20)
-    )
-
-    # Custom page size
-    page1_custom = await MemberService.search_members(
-        MemberSearchParams(q="Smith", page=1, page_size=10)
+    page1, page2, page1_custom = await asyncio.gather(
+        # First page (default: 20 results)
+        MemberService.search_members(
+            MemberSearchParams(q="Smith", page=1, page_size=20)
+        ),
+        # Second page
+        MemberService.search_members(
+            MemberSearchParams(q="Smith", page=2, page_size=20)
+        ),
+        # Custom page size
+        MemberService.search_members(
+            MemberSearchParams(q="Smith", page=1, page_size=10)
+        ),
     )
 
     # Check pagination info
@@ -293,7 +295,7 @@ async def example_response_structure():
 
     # Access individual results
     for member in response.results:
-        print(f"{member['name']} ({member['party']}-{member['state']})")
+        print(f"{member.name} ({member.party}-{member.state})")
 
     # Check if there are more pages
     if response.page < response.total_pages:
@@ -327,7 +329,7 @@ async def use_case_member_lookup():
 
     if results.total > 0:
         member = results.results[0]
-        print(f"Found: {member['name']} ({member['bioguide_id']})")
+        print(f"Found: {member.name} ({member.bioguide_id})")
     else:
         print("Member not found")
 
@@ -371,33 +373,29 @@ async def performance_tips():
     """
     Tips for optimal search performance.
     """
-    # 1. Use specific filters to reduce result set
-    # GOOD: Combines name + state filter
-    results = await MemberService.search_members(
-        MemberSearchParams(q="Smith", state="CA")
+    searches = [
+        # 1. Use specific filters to reduce result set
+        # GOOD: Combines name + state filter
+        MemberSearchParams(q="Smith", state="CA"),
+        # LESS OPTIMAL: Broad search returning many results
+        MemberSearchParams(q="a"),
+        # 2. Use appropriate page sizes
+        # GOOD: Reasonable page size
+        MemberSearchParams(q="Smith", page_size=20),
+        # LESS OPTIMAL: Very large page size
+        MemberSearchParams(q="Smith", page_size=100),
+        # 3. Be specific in searches
+        # GOOD: Full name or specific term
+        MemberSearchParams(q="Mike Lee"),
+        # LESS OPTIMAL: Very short partial match
+        MemberSearchParams(q="M"),
+    ]
+
+    # 4. Issue independent searches concurrently rather than one after another
+    results = await asyncio.gather(
+        *[MemberService.search_members(params) for params in searches]
     )
 
-    # LESS OPTIMAL: Broad search returning many results
-    results = await MemberService.search_members(MemberSearchParams(q="a"))
-
-    # 2. Use appropriate page sizes
-    # GOOD: Reasonable page size
-    results = await MemberService.search_members(
-        MemberSearchParams(q="Smith", page_size=20)
-    )
-
-    # LESS OPTIMAL: Very large page size
-    results = await MemberService.search_members(
-        MemberSearchParams(q="Smith", page_size=100)
-    )
-
-    # 3. Be specific in searches
-    # GOOD: Full name or specific term
-    results = await MemberService.search_members(MemberSearchParams(q="Mike Lee"))
-
-    # LESS OPTIMAL: Very short partial match
-    results = await MemberService.search_members(MemberSearchParams(q="M"))
-
 
 # ==============================================================================
 # HELPER FUNCTIONS
@@ -421,11 +419,11 @@ async def print_search_results(params: MemberSearchParams):
     print(f"Page {response.page} of {response.total_pages}\n")
 
     for i, member in enumerate(response.results, 1):
-        district = f" (District {member['district']})" if member.get("district") else ""
+        district = f" (District {member.district})" if member.district else ""
         print(
-            f"{i:2d}. {member['name']:30s} "
-            f"({member['party']}-{member['state']}) "
-            f"{member['chamber'].title()}{district}"
+            f"{i:2d}. {member.name:30s} "
+            f"({member.party}-{member.state}) "
+            f"{member.chamber.title()}{district}"
         )
 
     print(f"\n{'='*80}\n")
@@ -464,6 +462,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -2,18 +2,80 @@
 Member service layer - business logic for member operations.
 """
 
+import asyncio
+import functools
 import logging
-import re
-from datetime import datetime
+import time
 from typing import Optional
 
+from bson.regex import Regex
+from django.conf import settings
+from pymongo import ReturnDocument
+
+from config.cache import AsyncTTLCache
 from config.database import get_collection
-from members.clients.congress import get_congress_client
-from members.models import Member, MemberSearchParams, MemberSummary, PaginatedResponse
+from members.clients.congress import get_congress_client, tokenize_name
+from members.models import (
+    Member,
+    MemberSearchParams,
+    MemberSummaryStruct,
+    PaginatedResponse,
+    to_epoch_seconds,
+)
 
 logger = logging.getLogger(__name__)
 
-
+# Single search words shorter than this stay on the regex path: the text
+# index only matches whole (stemmed) words, so "Jo" would never find "John".
+MIN_TEXT_SEARCH_LENGTH = 3
+
+# Regex word-boundary prefix used when assembling name patterns
+WORD_BOUNDARY = "\\b"
+
+# Queries of up to this many words are matched against the indexed
+# name_tokens field; longer ones use the text index.
+MAX_TOKEN_SEARCH_WORDS = 2
+
+# Aggregates and the unfiltered listing only change when members are synced,
+# so serve them from memory. sync_members runs in its own process; the TTL
+# bounds staleness there.
+STATS_CACHE_TTL = 300  # seconds
+_aggregate_cache = AsyncTTLCache(ttl=STATS_CACHE_TTL)
+
+# Unfiltered member listing pages, keyed by (page, page_size); both come
+# from the query string, so bound the number of distinct pages kept
+ALL_MEMBERS_CACHE_TTL = 60  # seconds
+ALL_MEMBERS_CACHE_SIZE = 256
+_all_members_cache = AsyncTTLCache(
+    ttl=ALL_MEMBERS_CACHE_TTL, maxsize=ALL_MEMBERS_CACHE_SIZE
+)
+
+# Stored members older than this are returned as-is but refreshed from the
+# Congress API in the background
+MEMBER_REFRESH_AGE = 24 * 60 * 60  # seconds
+
+# In-flight API fetches keyed by bioguide_id; concurrent requests for the
+# same member share one fetch (this also keeps the tasks referenced)
+_member_fetches: dict[str, asyncio.Task] = {}
+
+# Fields returned for list rows (MemberSummary); keeps search payloads small
+MEMBER_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "bioguide_id": 1,
+    "name": 1,
+    "party": 1,
+    "state": 1,
+    "district": 1,
+    "chamber": 1,
+    "image_url": 1,
+}
+
+
+# str.translate table backslash-escaping the PCRE metacharacters
+_REGEX_ESCAPE_TABLE = str.maketrans({c: "\\" + c for c in "\\.^$*+?()[]{}|"})
+
+
+@functools.lru_cache(maxsize=2048)
 def _escape_regex_special_chars(text: str) -> str:
     """
     Escape special regex characters for safe MongoDB regex queries.
@@ -27,40 +89,12 @@ def _escape_regex_special_chars(text: str) -> str:
     Example:
         >>> _escape_regex_special_chars("O'Brien")
         "O'Brien"
-        >>> _escape_regex_special_chars("Smith (Jr.)")
-        "Smith \\(Jr\\.\\)"
-    """
-    # Escape regex special characters that could break the pattern
-    special_chars = r'\.^$*+?{}[]()|\\'
-    escaped = text
-    for char in special_chars:
-        escaped = escaped.replace(char, f'\\{char}')
-    return escaped
-
-
-def _normalize_search_term(search_term: str) -> str:
+        >>> _escape_regex_special_chars("(Jr.)")
+        "\\(Jr\\.\\)"
     """
-    Normalize search term for consistent matching.
-
-    Handles:
-    - Extra whitespace
-    - Multiple spaces between words
-    - Leading/trailing whitespace
-
-    Args:
-        search_term: Raw user search input
-
-    Returns:
-        Normalized search term
-
-    Example:
-        >>> _normalize_search_term("  Mike   Lee  ")
-        "Mike Lee"
-        >>> _normalize_search_term("Mary-Kate")
-        "Mary-Kate"
-    """
-    # Replace multiple spaces with single space, strip leading/trailing
-    return re.sub(r'\s+', ' ', search_term.strip())
+    # One C-level pass over the string; unlike re.escape it leaves spaces,
+    # hyphens and other non-metacharacters alone
+    return text.translate(_REGEX_ESCAPE_TABLE)
 
 
 def _build_single_word_query(word: str) -> dict:
@@ -68,7 +102,11 @@ def _build_single_word_query(word: str) -> dict:
     Build MongoDB query for single word search.
 
     Searches across first_name, last_name, and full name fields.
-    Uses word boundary for partial matching (e.g., "Mic" matches "Michael").
+    Patterns are anchored to the start of the field for prefix matching
+    (e.g., "Mic" matches "Michael"), so MongoDB can answer each branch with
+    an index scan instead of a collection scan.
+    Patterns are native BSON Regex values, which MongoDB treats like
+    {"$regex": ..., "$options": "i"} without the string options handling.
 
     Args:
         word: Single search word (already escaped)
@@ -80,18 +118,19 @@ def _build_single_word_query(word: str) -> dict:
         >>> _build_single_word_query("Mike")
         {
             "$or": [
-                {"first_name": {"$regex": "\\bMike", "$options": "i"}},
-                {"last_name": {"$regex": "\\bMike", "$options": "i"}},
-                {"name": {"$regex": "\\bMike", "$options": "i"}}
+                {"first_name": Regex("^Mike", "i")},
+                {"last_name": Regex("^Mike", "i")},
+                {"name": Regex("^Mike", "i")}
             ]
         }
     """
-    pattern = f"\\b{word}"
+    # One Regex value shared by all three branches
+    prefix = Regex(f"^{word}", "i")
     return {
         "$or": [
-            {"first_name": {"$regex": pattern, "$options": "i"}},
-            {"last_name": {"$regex": pattern, "$options": "i"}},
-            {"name": {"$regex": pattern, "$options": "i"}},
+            {"first_name": prefix},
+            {"last_name": prefix},
+            {"name": prefix},
         ]
     }
 
@@ -115,34 +154,24 @@ def _build_two_word_query(first_word: str, second_word: str) -> dict:
         # Returns query matching:
         # - first_name: Mike, last_name: Lee
         # - first_name: Lee, last_name: Mike
-        # - name: "Mike.*Lee" or "Lee.*Mike"
+        # - name: contains both "Mike" and "Lee", in any order
     """
-    first_pattern = f"\\b{first_word}"
-    second_pattern = f"\\b{second_word}"
+    first_pattern = WORD_BOUNDARY + first_word
+    second_pattern = WORD_BOUNDARY + second_word
+    # Each word's Regex is built once and reused across branches
+    first_re = Regex(first_pattern, "i")
+    second_re = Regex(second_pattern, "i")
 
     return {
         "$or": [
             # Try as "First Last"
-            {
-                "$and": [
-                    {"first_name": {"$regex": first_pattern, "$options": "i"}},
-                    {"last_name": {"$regex": second_pattern, "$options": "i"}},
-                ]
-            },
+            {"$and": [{"first_name": first_re}, {"last_name": second_re}]},
             # Try as "Last First"
-            {
-                "$and": [
-                    {"first_name": {"$regex": second_pattern, "$options": "i"}},
-                    {"last_name": {"$regex": first_pattern, "$options": "i"}},
-                ]
-            },
-            # Try against full name field in both orders
-            {
-                "name": {
-                    "$regex": f"{first_pattern}.*{second_pattern}|{second_pattern}.*{first_pattern}",
-                    "$options": "i",
-                }
-            },
+            {"$and": [{"first_name": second_re}, {"last_name": first_re}]},
+            # Try against full name field in either order. Two start-anchored
+            # lookaheads match both orders in one pass, instead of an
+            # alternation of two backtracking ".*" patterns
+            {"name": Regex(f"^(?=.*{first_pattern})(?=.*{second_pattern})", "i")},
         ]
     }
 
@@ -172,54 +201,44 @@ def _build_multi_word_query(words: list[str]) -> dict:
     """
     patterns = []
 
-    # Build pattern for full name with all parts in sequence
-    full_pattern = ".*".join(f"\\b{word}" for word in words)
-    patterns.append({"name": {"$regex": full_pattern, "$options": "i"}})
+    # Build pattern for full name with all parts in sequence (list + join
+    # avoids a generator frame and an f-string per word)
+    full_pattern = ".*".join([WORD_BOUNDARY + word for word in words])
+    patterns.append({"name": Regex(full_pattern, "i")})
 
     # Try first word as first_name, last word as last_name
-    first_pattern = f"\\b{words[0]}"
-    last_pattern = f"\\b{words[-1]}"
+    first_pattern = WORD_BOUNDARY + words[0]
+    last_pattern = WORD_BOUNDARY + words[-1]
+    # Built once, reused by every branch below
+    first_re = Regex(first_pattern, "i")
+    last_re = Regex(last_pattern, "i")
 
-    patterns.append(
-        {
-            "$and": [
-                {"first_name": {"$regex": first_pattern, "$options": "i"}},
-                {"last_name": {"$regex": last_pattern, "$options": "i"}},
-            ]
-        }
-    )
+    patterns.append({"$and": [{"first_name": first_re}, {"last_name": last_re}]})
 
     # Try reversed: last word as first_name, first word as last_name
-    patterns.append(
-        {
-            "$and": [
-                {"first_name": {"$regex": last_pattern, "$options": "i"}},
-                {"last_name": {"$regex": first_pattern, "$options": "i"}},
-            ]
-        }
-    )
+    patterns.append({"$and": [{"first_name": last_re}, {"last_name": first_re}]})
 
     # Try middle combinations for 3-word names
     # e.g., "Mary Jane Smith" could be first_name="Mary Jane", last_name="Smith"
     if len(words) == 3:
         # Try first two words as first_name, last word as last_name
-        first_two_pattern = f"\\b{words[0]}.*\\b{words[1]}"
+        first_two_pattern = first_pattern + ".*" + WORD_BOUNDARY + words[1]
         patterns.append(
             {
                 "$and": [
-                    {"first_name": {"$regex": first_two_pattern, "$options": "i"}},
-                    {"last_name": {"$regex": last_pattern, "$options": "i"}},
+                    {"first_name": Regex(first_two_pattern, "i")},
+                    {"last_name": last_re},
                 ]
             }
         )
 
         # Try first word as first_name, last two words as last_name
-        last_two_pattern = f"\\b{words[1]}.*\\b{words[2]}"
+        last_two_pattern = WORD_BOUNDARY + words[1] + ".*" + last_pattern
         patterns.append(
             {
                 "$and": [
-                    {"first_name": {"$regex": first_pattern, "$options": "i"}},
-                    {"last_name": {"$regex": last_two_pattern, "$options": "i"}},
+                    {"first_name": first_re},
+                    {"last_name": Regex(last_two_pattern, "i")},
                 ]
             }
         )
@@ -227,6 +246,14 @@ def _build_multi_word_query(words: list[str]) -> dict:
     return {"$or": patterns}
 
 
+# Word-count dispatch for the 1- and 2-word hot paths; 3+ words fall back to
+# _build_multi_word_query
+_WORD_COUNT_BUILDERS = {
+    1: _build_single_word_query,
+    2: _build_two_word_query,
+}
+
+
 def _build_name_search_query(search_term: str) -> dict:
     """
     Build flexible MongoDB query for name searching.
@@ -234,7 +261,8 @@ def _build_name_search_query(search_term: str) -> dict:
     Supports:
     - Single word: matches first_name, last_name, or full name
     - Multiple words: tries "First Last" and "Last First" combinations
-    - Partial matching with word boundaries
+    - Partial matching: start-anchored for single words, word boundaries
+      for multi-word searches
     - Case-insensitive matching
     - Handles middle names and complex name structures
 
@@ -242,15 +270,16 @@ def _build_name_search_query(search_term: str) -> dict:
         search_term: User's search query (e.g., "Mike", "Lee", "Mike Lee", "Lee Mike")
 
     Returns:
-        MongoDB query dict with $or conditions for flexible matching
+        MongoDB query dict with $or conditions for flexible matching.
+        Non-empty queries are memoized and shared - treat as read-only.
 
     Example:
         >>> _build_name_search_query("Mike")
         {
             "$or": [
-                {"first_name": {"$regex": "\\bMike", "$options": "i"}},
-                {"last_name": {"$regex": "\\bMike", "$options": "i"}},
-                {"name": {"$regex": "\\bMike", "$options": "i"}}
+                {"first_name": Regex("^Mike", "i")},
+                {"last_name": Regex("^Mike", "i")},
+                {"name": Regex("^Mike", "i")}
             ]
         }
 
@@ -259,37 +288,203 @@ def _build_name_search_query(search_term: str) -> dict:
             "$or": [
                 {
                     "$and": [
-                        {"first_name": {"$regex": "\\bMike", "$options": "i"}},
-                        {"last_name": {"$regex": "\\bLee", "$options": "i"}}
+                        {"first_name": Regex("\\bMike", "i")},
+                        {"last_name": Regex("\\bLee", "i")}
                     ]
                 },
                 {
                     "$and": [
-                        {"first_name": {"$regex": "\\bLee", "$options": "i"}},
-                        {"last_name": {"$regex": "\\bMike", "$options": "i"}}
+                        {"first_name": Regex("\\bLee", "i")},
+                        {"last_name": Regex("\\bMike", "i")}
                     ]
                 },
-                {"name": {"$regex": "\\bMike.*\\bLee|\\bLee.*\\bMike", "$options": "i"}}
+                {"name": Regex("^(?=.*\\bMike)(?=.*\\bLee)", "i")}
             ]
         }
     """
-    # Normalize and split into parts
-    normalized = _normalize_search_term(search_term)
-    if not normalized:
+    # split() with no argument trims the ends and collapses whitespace runs,
+    # so "  Mike   Lee  " and "Mike Lee" yield the same parts (and cache key)
+    parts = tuple(search_term.split())
+    if not parts:
         return {}
 
-    parts = normalized.split()
+    return _cached_name_search_query(parts)
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_name_search_query(parts: tuple[str, ...]) -> dict:
+    """
+    Build and memoize the name search query for pre-split search words.
 
+    Repeated searches ("Mike", "Smith", ...) skip escaping and query
+    construction entirely. The cached dict is shared between callers and
+    must be treated as read-only (search_members only embeds it in a
+    larger filter).
+
+    Args:
+        parts: Non-empty tuple of raw (unescaped) search words
+
+    Returns:
+        MongoDB query dict (shared, do not mutate)
+    """
     # Escape special regex characters in each part
     escaped_parts = [_escape_regex_special_chars(part) for part in parts]
 
     # Route to appropriate query builder based on word count
-    if len(escaped_parts) == 1:
-        return _build_single_word_query(escaped_parts[0])
-    elif len(escaped_parts) == 2:
-        return _build_two_word_query(escaped_parts[0], escaped_parts[1])
+    builder = _WORD_COUNT_BUILDERS.get(len(escaped_parts))
+    if builder is not None:
+        return builder(*escaped_parts)
+    return _build_multi_word_query(escaped_parts)
+
+
+def _build_text_search_query(parts: list[str]) -> dict:
+    """
+    Build an index-backed MongoDB query for name searching.
+
+    Uses the member_text_search text index (name, first_name, last_name)
+    instead of unanchored regexes, which force a collection scan. Because
+    $text only matches whole words, prefix matches ("Mic" -> "Michael") are
+    kept with start-anchored regexes on the indexed first_name/last_name
+    fields. MongoDB requires every $or branch next to $text to be indexed.
+
+    Args:
+        parts: Non-empty list of raw (unescaped) search words
+
+    Returns:
+        MongoDB query dict combining $text with prefix fallbacks
+
+    Example:
+        >>> _build_text_search_query(["Mike", "Lee"])
+        {
+            "$or": [
+                {"$text": {"$search": '"Mike" "Lee"'}},
+                {
+                    "first_name": Regex("^Mike", "i"),
+                    "last_name": Regex("^Lee", "i")
+                }
+            ]
+        }
+    """
+    # Quote each word so all of them must match (bare $text terms are OR-ed)
+    text_search = " ".join('"' + part.replace('"', "") + '"' for part in parts)
+
+    first_prefix = Regex(f"^{_escape_regex_special_chars(parts[0])}", "i")
+    last_prefix = Regex(f"^{_escape_regex_special_chars(parts[-1])}", "i")
+
+    if len(parts) == 1:
+        prefix_branches = [{"first_name": first_prefix}, {"last_name": last_prefix}]
     else:
-        return _build_multi_word_query(escaped_parts)
+        prefix_branches = [{"first_name": first_prefix, "last_name": last_prefix}]
+
+    return {"$or": [{"$text": {"$search": text_search}}, *prefix_branches]}
+
+
+def _build_token_search_query(parts: list[str]) -> dict:
+    """
+    Build a query against the precomputed name_tokens field.
+
+    Whole-word matches are exact lookups on the multikey name_tokens index
+    (filled at ingest by CongressClient.transform_member), so no regex is
+    compiled or evaluated. Prefix matches ("Mic" -> "Michael") are kept with
+    start-anchored regexes on the indexed first_name/last_name fields.
+
+    Args:
+        parts: Non-empty list of raw search words
+
+    Returns:
+        MongoDB query dict combining the token lookup with prefix fallbacks
+
+    Example:
+        >>> _build_token_search_query(["Mike", "Lee"])
+        {
+            "$or": [
+                {"name_tokens": {"$all": ["lee", "mike"]}},
+                {
+                    "first_name": Regex("^Mike", "i"),
+                    "last_name": Regex("^Lee", "i")
+                }
+            ]
+        }
+    """
+    first_prefix = Regex(f"^{_escape_regex_special_chars(parts[0])}", "i")
+    last_prefix = Regex(f"^{_escape_regex_special_chars(parts[-1])}", "i")
+
+    if len(parts) == 1:
+        prefix_branches = [{"first_name": first_prefix}, {"last_name": last_prefix}]
+    else:
+        prefix_branches = [{"first_name": first_prefix, "last_name": last_prefix}]
+
+    return {
+        "$or": [{"name_tokens": {"$all": tokenize_name(*parts)}}, *prefix_branches]
+    }
+
+
+@functools.lru_cache(maxsize=2048)
+def _name_filter_for_parts(parts: tuple[str, ...]) -> dict:
+    """
+    Choose and memoize the name filter search_members uses for a query.
+
+    Popular searches ("Mike", "Smith", "Pelosi") repeat heavily, so the
+    routing, escaping and dict construction happen once per distinct query.
+    The cached dict is shared and must be treated as read-only.
+
+    Args:
+        parts: Non-empty tuple of raw search words
+
+    Returns:
+        MongoDB query dict (shared, do not mutate)
+    """
+    if len(parts) == 1 and len(parts[0]) < MIN_TEXT_SEARCH_LENGTH:
+        return _build_name_search_query(parts[0])
+    if len(parts) <= MAX_TOKEN_SEARCH_WORDS:
+        return _build_token_search_query(list(parts))
+    return _build_text_search_query(list(parts))
+
+
+def _build_atlas_search_stage(index: str, parts: list[str]) -> dict:
+    """
+    Build an Atlas Search $search stage for name searching.
+
+    One Lucene index serves every name permutation: each word is matched
+    as an autocomplete (prefix) on first_name and last_name, and the whole
+    query as text on the full name. Used instead of the regex/$text filters
+    when settings.MEMBERS_ATLAS_SEARCH_INDEX is set.
+
+    Args:
+        index: Atlas Search index name
+        parts: Non-empty list of raw search words
+
+    Returns:
+        $search pipeline stage (must be the first stage)
+
+    Example:
+        >>> _build_atlas_search_stage("members_name", ["Mike"])
+        {
+            "$search": {
+                "index": "members_name",
+                "compound": {
+                    "should": [
+                        {"autocomplete": {"query": "Mike", "path": "first_name"}},
+                        {"autocomplete": {"query": "Mike", "path": "last_name"}},
+                        {"text": {"query": "Mike", "path": "name"}}
+                    ],
+                    "minimumShouldMatch": 1
+                }
+            }
+        }
+    """
+    should = []
+    for part in parts:
+        should.append({"autocomplete": {"query": part, "path": "first_name"}})
+        should.append({"autocomplete": {"query": part, "path": "last_name"}})
+    should.append({"text": {"query": " ".join(parts), "path": "name"}})
+
+    return {
+        "$search": {
+            "index": index,
+            "compound": {"should": should, "minimumShouldMatch": 1},
+        }
+    }
 
 
 class MemberService:
@@ -309,9 +504,17 @@ class MemberService:
         - Middle names and initials: "John Q. Public"
 
         Search Performance Notes:
-        - Uses MongoDB regex queries with word boundaries for accurate partial matching
-        - Multiple $or conditions allow flexible name ordering
-        - For large datasets (>100k members), consider adding MongoDB text indexes
+        - One- and two-word searches are exact lookups on the multikey
+          name_tokens index; longer ones use the member_text_search text
+          index. Both add start-anchored prefix regexes on
+          first_name/last_name
+        - Single words shorter than MIN_TEXT_SEARCH_LENGTH fall back to the
+          word-boundary regex query (_build_name_search_query)
+        - Page and total come from one $facet aggregation, and the page is
+          projected to MEMBER_SUMMARY_PROJECTION so full documents (terms,
+          contact info, ...) never leave the server
+        - With settings.MEMBERS_ATLAS_SEARCH_INDEX set (Atlas only), name
+          matching is a single $search stage instead of the filters above
         - Query complexity scales with number of search terms
 
         Args:
@@ -345,8 +548,6 @@ class MemberService:
             >>> await search_members(MemberSearchParams(q="Smith", state="CA", party="D"))
             # Returns: Democratic Smiths from California only
         """
-        collection = await get_collection("members")
-
         # Build base query with filters
         query = {}
 
@@ -361,9 +562,15 @@ class MemberService:
 
         # Add flexible name search if query provided
         if params.q:
-            search_term = params.q.strip()
-            if search_term:
-                name_query = _build_name_search_query(search_term)
+            parts = params.q.split()
+            if parts and settings.MEMBERS_ATLAS_SEARCH_INDEX:
+                # Atlas Search does the name matching; filters follow as $match
+                search_stage = _build_atlas_search_stage(
+                    settings.MEMBERS_ATLAS_SEARCH_INDEX, parts
+                )
+                return await MemberService._run_search(query, params, search_stage)
+            if parts:
+                name_query = _name_filter_for_parts(tuple(parts))
 
                 # Combine name search with other filters
                 if query:
@@ -373,35 +580,58 @@ class MemberService:
                     # Only name search, no other filters
                     query = name_query
 
-        # Get total count
-        total = await collection.count_documents(query)
+        # The unfiltered listing (default landing page) is identical for every
+        # caller, so serve it from a short-lived per-page cache
+        if not query:
+            return await _all_members_cache.get_or_load(
+                (params.page, params.page_size),
+                lambda: MemberService._run_search(query, params),
+            )
+
+        return await MemberService._run_search(query, params)
+
+    @staticmethod
+    async def _run_search(
+        query: dict,
+        params: MemberSearchParams,
+        search_stage: Optional[dict] = None,
+    ) -> PaginatedResponse:
+        """
+        Run a member search filter and build the paginated response.
+
+        search_stage, when given, is an Atlas Search $search stage placed
+        ahead of the $match filter.
+        """
+        collection = await get_collection("members")
 
-        # Calculate pagination
+        # Fetch the page and the total count in one aggregation ($facet), so
+        # the filter is evaluated once instead of by count_documents + find
         skip = (params.page - 1) * params.page_size
-        total_pages = (total + params.page_size - 1) // params.page_size
+        pipeline = [search_stage] if search_stage else []
+        pipeline += [
+            {"$match": query},
+            {
+                "$facet": {
+                    # Sort by last_name for consistency, then first_name for ties
+                    "results": [
+                        {"$sort": {"last_name": 1, "first_name": 1}},
+                        {"$skip": skip},
+                        {"$limit": params.page_size},
+                        {"$project": MEMBER_SUMMARY_PROJECTION},
+                    ],
+                    "total": [{"$count": "n"}],
+                }
+            },
+        ]
+        facets = await collection.aggregate(pipeline).to_list(length=1)
+        page_docs = facets[0]["results"] if facets else []
+        total = facets[0]["total"][0]["n"] if facets and facets[0]["total"] else 0
 
-        # Fetch results with sorting
-        # Sort by last_name for consistency, then first_name for ties
-        cursor = (
-            collection.find(query)
-            .sort([("last_name", 1), ("first_name", 1)])
-            .skip(skip)
-            .limit(params.page_size)
-        )
+        total_pages = (total + params.page_size - 1) // params.page_size
 
-        results = []
-        async for doc in cursor:
-            results.append(
-                MemberSummary(
-                    bioguide_id=doc["bioguide_id"],
-                    name=doc["name"],
-                    party=doc["party"],
-                    state=doc["state"],
-                    district=doc.get("district"),
-                    chamber=doc["chamber"],
-                    image_url=doc.get("image_url"),
-                ).model_dump()
-            )
+        # Rows are msgspec structs built straight from the projected docs (no
+        # per-row validation or model_dump); the view encodes them to JSON
+        results = [MemberSummaryStruct(**doc) for doc in page_docs]
 
         return PaginatedResponse(
             results=results,
@@ -416,7 +646,9 @@ class MemberService:
         """
         Get a member by bioguide ID.
 
-        First checks local database, fetches from API if not found.
+        First checks local database, fetches from API if not found. A stored
+        member older than MEMBER_REFRESH_AGE is returned immediately while a
+        background task refreshes it, so only a cold miss waits on the API.
         """
         collection = await get_collection("members")
 
@@ -424,27 +656,89 @@ class MemberService:
         doc = await collection.find_one({"bioguide_id": bioguide_id})
         if doc:
             doc.pop("_id", None)
+            updated_at = doc.get("updated_at")
+            # Records synced before updated_at became epoch seconds are stale;
+            # still answer with epoch seconds, like the refreshed record will
+            if not isinstance(updated_at, int) or (
+                updated_at < time.time() - MEMBER_REFRESH_AGE
+            ):
+                MemberService._schedule_member_fetch(bioguide_id)
+            if "updated_at" in doc:
+                doc["updated_at"] = to_epoch_seconds(updated_at)
             return doc
 
-        # Fetch from API if not in database
+        # Fetch from API if not in database; shield the shared task so one
+        # caller going away doesn't cancel it for the others
+        return await asyncio.shield(MemberService._schedule_member_fetch(bioguide_id))
+
+    @staticmethod
+    def _schedule_member_fetch(bioguide_id: str) -> asyncio.Task:
+        """Start (or join) the API fetch for a member and return its task."""
+        task = _member_fetches.get(bioguide_id)
+        if task is None:
+            task = asyncio.create_task(
+                MemberService._fetch_and_store_member(bioguide_id)
+            )
+            _member_fetches[bioguide_id] = task
+            task.add_done_callback(lambda _: _member_fetches.pop(bioguide_id, None))
+        return task
+
+    @staticmethod
+    async def _fetch_and_store_member(bioguide_id: str) -> Optional[dict]:
+        """Fetch a member from the Congress API and upsert it locally."""
         try:
             client = get_congress_client()
             data = await client.get_member(bioguide_id)
             member_data = client.transform_member(data)
-            member_data["updated_at"] = datetime.utcnow()
+            member_data["updated_at"] = int(time.time())
 
             # Store in database
-            await collection.update_one(
+            collection = await get_collection("members")
+            previous = await collection.find_one_and_update(
                 {"bioguide_id": bioguide_id},
                 {"$set": member_data},
+                projection={"_id": 0},
                 upsert=True,
+                return_document=ReturnDocument.BEFORE,
             )
+            # Background refreshes mostly rewrite identical data; only a new
+            # or changed member can change the cached aggregates and pages
+            if previous is None or any(
+                previous.get(field) != value
+                for field, value in member_data.items()
+                if field != "updated_at"
+            ):
+                MemberService.invalidate_caches()
 
             return member_data
         except Exception as e:
             logger.error(f"Failed to fetch member {bioguide_id}: {e}")
             return None
 
+    @staticmethod
+    async def _fetch_member_bills(
+        client, bioguide_id: str, bill_type: str, limit: int, offset: int
+    ) -> list[dict]:
+        """Fetch and transform one bill list ('sponsored' or 'cosponsored')."""
+        if bill_type == "cosponsored":
+            data = await client.get_member_cosponsored_legislation(
+                bioguide_id, limit=limit, offset=offset
+            )
+            key = "cosponsoredLegislation"
+        else:
+            data = await client.get_member_sponsored_legislation(
+                bioguide_id, limit=limit, offset=offset
+            )
+            key = "sponsoredLegislation"
+
+        # Transform bills (filter out None values for amendments)
+        bills = []
+        for item in data.get(key, []):
+            transformed = client.transform_bill(item)
+            if transformed is not None:  # Skip amendments and invalid items
+                bills.append(transformed)
+        return bills
+
     @staticmethod
     async def get_member_bills(
         bioguide_id: str,
@@ -464,21 +758,9 @@ class MemberService:
         client = get_congress_client()
 
         try:
-            if bill_type == "cosponsored":
-                data = await client.get_member_cosponsored_legislation(
-                    bioguide_id, limit=limit, offset=offset
-                )
-            else:
-                data = await client.get_member_sponsored_legislation(
-                    bioguide_id, limit=limit, offset=offset
-                )
-
-            # Transform bills (filter out None values for amendments)
-            bills = []
-            for item in data.get("sponsoredLegislation", data.get("cosponsoredLegislation", [])):
-                transformed = client.transform_bill(item)
-                if transformed is not None:  # Skip amendments and invalid items
-                    bills.append(transformed)
+            bills = await MemberService._fetch_member_bills(
+                client, bioguide_id, bill_type, limit, offset
+            )
 
             return {
                 "results": bills,
@@ -488,6 +770,51 @@ class MemberService:
             logger.error(f"Failed to fetch bills for {bioguide_id}: {e}")
             return {"results": [], "total": 0, "error": str(e)}
 
+    @staticmethod
+    async def get_member_bills_both(
+        bioguide_id: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict:
+        """
+        Get sponsored and cosponsored bills for a member in one call.
+
+        Both Congress API requests run concurrently. A failure in one list
+        is reported in that list's "error" key without dropping the other.
+
+        Args:
+            bioguide_id: Member's bioguide ID
+            limit: Number of results per list
+            offset: Pagination offset
+
+        Returns:
+            {"sponsored": {...}, "cosponsored": {...}}, each shaped like
+            get_member_bills()
+        """
+        client = get_congress_client()
+        bill_types = ("sponsored", "cosponsored")
+
+        fetched = await asyncio.gather(
+            *[
+                MemberService._fetch_member_bills(
+                    client, bioguide_id, bill_type, limit, offset
+                )
+                for bill_type in bill_types
+            ],
+            return_exceptions=True,
+        )
+
+        result = {}
+        for bill_type, bills in zip(bill_types, fetched):
+            if isinstance(bills, Exception):
+                logger.error(
+                    f"Failed to fetch {bill_type} bills for {bioguide_id}: {bills}"
+                )
+                result[bill_type] = {"results": [], "total": 0, "error": str(bills)}
+            else:
+                result[bill_type] = {"results": bills, "total": len(bills)}
+        return result
+
     @staticmethod
     async def get_member_amendments(
         bioguide_id: str,
@@ -527,9 +854,22 @@ class MemberService:
             logger.error(f"Failed to fetch amendments for {bioguide_id}: {e}")
             return {"results": [], "total": 0, "error": str(e)}
 
+    @staticmethod
+    def invalidate_caches():
+        """Drop cached aggregates and listing pages (call after members change)."""
+        _aggregate_cache.invalidate()
+        _all_members_cache.invalidate()
+
     @staticmethod
     async def get_states_with_members() -> list[dict]:
-        """Get list of states with member counts."""
+        """Get list of states with member counts (cached for STATS_CACHE_TTL)."""
+        return await _aggregate_cache.get_or_load(
+            "states", MemberService._load_states_with_members
+        )
+
+    @staticmethod
+    async def _load_states_with_members() -> list[dict]:
+        """Aggregate member counts per state."""
         collection = await get_collection("members")
 
         pipeline = [
@@ -537,34 +877,41 @@ class MemberService:
             {"$sort": {"_id": 1}},
         ]
 
-        results = []
-        async for doc in collection.aggregate(pipeline):
-            results.append({"state": doc["_id"], "count": doc["count"]})
-
-        return results
+        # One awaited batch instead of an event-loop hop per document
+        docs = await collection.aggregate(pipeline).to_list(length=None)
+        return [{"state": doc["_id"], "count": doc["count"]} for doc in docs]
 
     @staticmethod
     async def get_member_stats() -> dict:
-        """Get aggregate statistics about members."""
-        collection = await get_collection("members")
+        """Get aggregate statistics about members (cached for STATS_CACHE_TTL)."""
+        return await _aggregate_cache.get_or_load(
+            "stats", MemberService._load_member_stats
+        )
 
-        # Party breakdown
-        party_pipeline = [
-            {"$group": {"_id": "$party", "count": {"$sum": 1}}},
-        ]
-        party_counts = {}
-        async for doc in collection.aggregate(party_pipeline):
-            party_counts[doc["_id"]] = doc["count"]
+    @staticmethod
+    async def _load_member_stats() -> dict:
+        """Aggregate party/chamber breakdowns and the member total."""
+        collection = await get_collection("members")
 
-        # Chamber breakdown
-        chamber_pipeline = [
-            {"$group": {"_id": "$chamber", "count": {"$sum": 1}}},
+        # One round trip: $facet shares a single collection pass across the
+        # party and chamber breakdowns. Every member has exactly one party
+        # group, so the total is their sum (no separate count needed)
+        pipeline = [
+            {
+                "$facet": {
+                    "by_party": [{"$group": {"_id": "$party", "count": {"$sum": 1}}}],
+                    "by_chamber": [
+                        {"$group": {"_id": "$chamber", "count": {"$sum": 1}}}
+                    ],
+                }
+            }
         ]
-        chamber_counts = {}
-        async for doc in collection.aggregate(chamber_pipeline):
-            chamber_counts[doc["_id"]] = doc["count"]
+        facets = await collection.aggregate(pipeline).to_list(length=1)
+        doc = facets[0] if facets else {}
 
-        total = await collection.count_documents({})
+        party_counts = {g["_id"]: g["count"] for g in doc.get("by_party", [])}
+        chamber_counts = {g["_id"]: g["count"] for g in doc.get("by_chamber", [])}
+        total = sum(party_counts.values())
 
         return {
             "total": total,
@@ -5,9 +5,23 @@ Tests the flexible name search in services._build_name_search_query
 and MemberService.search_members.
 """
 
+import re
+from types import SimpleNamespace
+
 import pytest
+from bson.regex import Regex
 
-from members.services import _build_name_search_query, _escape_regex_special_chars
+from config import database
+from members.clients.congress import tokenize_name
+from members.services import (
+    _build_atlas_search_stage,
+    _build_name_search_query,
+    _build_text_search_query,
+    _build_token_search_query,
+    _cached_name_search_query,
+    _escape_regex_special_chars,
+    _name_filter_for_parts,
+)
 
 
 class TestEscapeRegexSpecialChars:
@@ -30,7 +44,7 @@ class TestEscapeRegexSpecialChars:
     def test_escapes_period(self):
         """Should escape periods in names with initials."""
         result = _escape_regex_special_chars("John D. Smith")
-        # Check that period is escaped
+        # Check that period is escaped but spaces are not
         assert r"\." in result
         assert "John D" in result
 
@@ -52,8 +66,14 @@ class TestEscapeRegexSpecialChars:
 
     def test_no_escaping_needed(self):
         """Should handle normal names without modification."""
-        result = _escape_regex_special_chars("John Smith")
-        assert result == "John Smith"
+        # Callers escape one whitespace-split word at a time
+        assert _escape_regex_special_chars("John") == "John"
+        assert _escape_regex_special_chars("Smith") == "Smith"
+
+    def test_escapes_each_char_once(self):
+        """Each special char gets exactly one backslash (no double escaping)."""
+        assert _escape_regex_special_chars("(Jr.)") == r"\(Jr\.\)"
+        assert _escape_regex_special_chars("a\\b") == "a\\\\b"
 
 
 class TestBuildNameSearchQuery:
@@ -70,24 +90,24 @@ class TestBuildNameSearchQuery:
         assert len(conditions) == 3
 
         # Check first_name condition
-        assert {"first_name": {"$regex": "\\bMike", "$options": "i"}} in conditions
+        assert {"first_name": Regex("^Mike", "i")} in conditions
 
         # Check last_name condition
-        assert {"last_name": {"$regex": "\\bMike", "$options": "i"}} in conditions
+        assert {"last_name": Regex("^Mike", "i")} in conditions
 
         # Check full name condition
-        assert {"name": {"$regex": "\\bMike", "$options": "i"}} in conditions
+        assert {"name": Regex("^Mike", "i")} in conditions
 
-    def test_single_word_with_word_boundary(self):
-        """Word boundary should enable partial matching from start of words."""
+    def test_single_word_is_start_anchored(self):
+        """Start anchor should enable index-backed prefix matching."""
         query = _build_name_search_query("Mic")
 
-        # Check that pattern uses word boundary
-        first_name_pattern = query["$or"][0]["first_name"]["$regex"]
-        assert first_name_pattern == "\\bMic"
+        # Check that pattern is anchored to the start of the field
+        first_name_pattern = query["$or"][0]["first_name"].pattern
+        assert first_name_pattern == "^Mic"
 
         # This pattern should match "Michael", "Michelle", "Mick"
-        # but not "Dominic" because \b matches start of word
+        # but not "Dominic" because ^ only matches at the start
 
     def test_two_word_search_forward_order(self):
         """Two words should try both 'First Last' and 'Last First' orders."""
@@ -102,8 +122,8 @@ class TestBuildNameSearchQuery:
         # Check "Mike Lee" as first_name + last_name
         forward_condition = {
             "$and": [
-                {"first_name": {"$regex": "\\bMike", "$options": "i"}},
-                {"last_name": {"$regex": "\\bLee", "$options": "i"}},
+                {"first_name": Regex("\\bMike", "i")},
+                {"last_name": Regex("\\bLee", "i")},
             ]
         }
         assert forward_condition in conditions
@@ -111,8 +131,8 @@ class TestBuildNameSearchQuery:
         # Check "Lee Mike" as first_name + last_name (reversed)
         reverse_condition = {
             "$and": [
-                {"first_name": {"$regex": "\\bLee", "$options": "i"}},
-                {"last_name": {"$regex": "\\bMike", "$options": "i"}},
+                {"first_name": Regex("\\bLee", "i")},
+                {"last_name": Regex("\\bMike", "i")},
             ]
         }
         assert reverse_condition in conditions
@@ -128,10 +148,13 @@ class TestBuildNameSearchQuery:
         )
 
         assert full_name_condition is not None
-        pattern = full_name_condition["name"]["$regex"]
+        pattern = full_name_condition["name"].pattern
 
         # Should match both "Nancy...Pelosi" and "Pelosi...Nancy"
-        assert "\\bNancy.*\\bPelosi" in pattern or "\\bPelosi.*\\bNancy" in pattern
+        assert pattern == "^(?=.*\\bNancy)(?=.*\\bPelosi)"
+        assert re.search(pattern, "Nancy Pelosi")
+        assert re.search(pattern, "Pelosi, Nancy")
+        assert not re.search(pattern, "Nancy Mace")
 
     def test_three_word_search(self):
         """Three or more words should be handled gracefully."""
@@ -144,13 +167,11 @@ class TestBuildNameSearchQuery:
         assert len(conditions) >= 2
 
         # Should include full name pattern with all three words
-        full_name_patterns = [
-            c for c in conditions if "name" in c and "$and" not in c
-        ]
+        full_name_patterns = [c for c in conditions if "name" in c and "$and" not in c]
         assert len(full_name_patterns) > 0
 
         # Check that pattern includes all words in sequence
-        pattern = full_name_patterns[0]["name"]["$regex"]
+        pattern = full_name_patterns[0]["name"].pattern
         assert "\\bMartin" in pattern
         assert "\\bLuther" in pattern
         assert "\\bKing" in pattern
@@ -164,8 +185,8 @@ class TestBuildNameSearchQuery:
         # Should try "Mary" as first, "Smith" as last
         first_last_forward = {
             "$and": [
-                {"first_name": {"$regex": "\\bMary", "$options": "i"}},
-                {"last_name": {"$regex": "\\bSmith", "$options": "i"}},
+                {"first_name": Regex("\\bMary", "i")},
+                {"last_name": Regex("\\bSmith", "i")},
             ]
         }
         assert first_last_forward in conditions
@@ -173,8 +194,8 @@ class TestBuildNameSearchQuery:
         # Should try "Smith" as first, "Mary" as last (reversed)
         first_last_reverse = {
             "$and": [
-                {"first_name": {"$regex": "\\bSmith", "$options": "i"}},
-                {"last_name": {"$regex": "\\bMary", "$options": "i"}},
+                {"first_name": Regex("\\bSmith", "i")},
+                {"last_name": Regex("\\bMary", "i")},
             ]
         }
         assert first_last_reverse in conditions
@@ -193,34 +214,34 @@ class TestBuildNameSearchQuery:
         assert "$or" in query
 
         # The apostrophe should be in the pattern
-        first_name_pattern = query["$or"][0]["first_name"]["$regex"]
+        first_name_pattern = query["$or"][0]["first_name"].pattern
         assert "O'Brien" in first_name_pattern
 
     def test_case_insensitive_flag(self):
         """All patterns should have case-insensitive option."""
         query = _build_name_search_query("Mike Lee")
 
-        # Check all conditions have $options: "i"
+        # Check all conditions carry the IGNORECASE flag
         for condition in query["$or"]:
             if "$and" in condition:
                 for subcondition in condition["$and"]:
                     for field_query in subcondition.values():
-                        assert field_query["$options"] == "i"
+                        assert field_query.flags & re.IGNORECASE
             else:
                 for field_query in condition.values():
-                    assert field_query["$options"] == "i"
+                    assert field_query.flags & re.IGNORECASE
 
     def test_partial_matching_examples(self):
         """Test common partial matching scenarios."""
         # "Mic" should match start of "Michael", "Michelle", "Mick"
         query = _build_name_search_query("Mic")
-        pattern = query["$or"][0]["first_name"]["$regex"]
-        assert pattern == "\\bMic"
+        pattern = query["$or"][0]["first_name"].pattern
+        assert pattern == "^Mic"
 
         # "Smit" should match "Smith", "Smithson"
         query = _build_name_search_query("Smit")
-        pattern = query["$or"][0]["first_name"]["$regex"]
-        assert pattern == "\\bSmit"
+        pattern = query["$or"][0]["first_name"].pattern
+        assert pattern == "^Smit"
 
     def test_whitespace_normalization(self):
         """Should handle extra whitespace gracefully."""
@@ -230,6 +251,212 @@ class TestBuildNameSearchQuery:
         # Both should produce equivalent queries (ignoring whitespace)
         assert query1 == query2
 
+    def test_repeated_queries_are_cached(self):
+        """Equivalent search terms should reuse the memoized query."""
+        assert _build_name_search_query("Mike Lee") is _build_name_search_query(
+            "  Mike   Lee "
+        )
+
+
+class TestNameSearchQueryMemoization:
+    """
+    Regression guard for the memoized name query hot path.
+
+    Checks lru_cache hit counts rather than wall-clock time, so the guard
+    holds under coverage, tracing or a loaded runner.
+    """
+
+    @pytest.mark.parametrize(
+        "parts",
+        [("Mike", "Lee"), ("Pelosi",), ("Mary", "Jane", "Smith"), ("Mi",)],
+    )
+    def test_repeated_search_filter_is_cache_hit(self, parts):
+        """search_members' filter for a repeated query is built only once."""
+        first = _name_filter_for_parts(parts)
+        before = _name_filter_for_parts.cache_info()
+
+        for _ in range(100):
+            assert _name_filter_for_parts(parts) is first
+
+        after = _name_filter_for_parts.cache_info()
+        assert after.hits - before.hits == 100
+        assert after.misses == before.misses
+
+    @pytest.mark.parametrize("search_term", ["Mike Lee", "Mary Jane Smith"])
+    def test_repeated_regex_query_is_cache_hit(self, search_term):
+        """The regex query builder reuses its memoized result too."""
+        first = _build_name_search_query(search_term)
+        before = _cached_name_search_query.cache_info()
+
+        for _ in range(100):
+            assert _build_name_search_query(search_term) is first
+
+        after = _cached_name_search_query.cache_info()
+        assert after.hits - before.hits == 100
+        assert after.misses == before.misses
+
+
+class TestBuildTextSearchQuery:
+    """Test the text-index backed name search query builder."""
+
+    def test_single_word_uses_text_and_prefix_branches(self):
+        """Single word should hit the text index plus first/last name prefixes."""
+        query = _build_text_search_query(["Mic"])
+
+        assert query["$or"] == [
+            {"$text": {"$search": '"Mic"'}},
+            {"first_name": Regex("^Mic", "i")},
+            {"last_name": Regex("^Mic", "i")},
+        ]
+
+    def test_multi_word_requires_all_words(self):
+        """Each word is quoted so $text requires all of them."""
+        query = _build_text_search_query(["Nancy", "Pelosi"])
+
+        assert {"$text": {"$search": '"Nancy" "Pelosi"'}} in query["$or"]
+        assert {
+            "first_name": Regex("^Nancy", "i"),
+            "last_name": Regex("^Pelosi", "i"),
+        } in query["$or"]
+
+    def test_escapes_prefix_and_strips_quotes(self):
+        """Regex prefixes are escaped and quotes can't break the $text phrase."""
+        query = _build_text_search_query(['Smith"(Jr.)'])
+
+        assert query["$or"][0] == {"$text": {"$search": '"Smith(Jr.)"'}}
+        assert query["$or"][2]["last_name"].pattern == '^Smith"\\(Jr\\.\\)'
+
+
+class _RecordingCollection:
+    """Collection stand-in that records create_index calls."""
+
+    def __init__(self):
+        self.indexes = []
+
+    async def create_index(self, keys, **kwargs):
+        if isinstance(keys, str):
+            keys = [(keys, 1)]
+        self.indexes.append((keys, kwargs))
+
+    async def create_search_index(self, model):
+        pass
+
+
+class _RecordingDatabase(dict):
+    """Database stand-in handing out a recording collection per name."""
+
+    def __missing__(self, name):
+        self[name] = _RecordingCollection()
+        return self[name]
+
+
+class TestTextSearchIndexCoverage:
+    """$text queries are only valid if every other $or branch is indexed."""
+
+    @pytest.fixture
+    def member_indexes(self, monkeypatch):
+        """Indexes ensure_indexes creates on the members collection."""
+        db = _RecordingDatabase()
+
+        async def fake_get_database():
+            return db
+
+        monkeypatch.setattr(database, "get_database", fake_get_database)
+        monkeypatch.setattr(
+            database, "settings", SimpleNamespace(MEMBERS_ATLAS_SEARCH_INDEX="")
+        )
+        return db["members"].indexes
+
+    @staticmethod
+    def _regex_usable(indexes) -> list[str]:
+        """Leading fields of indexes a case-insensitive regex can use."""
+        return [
+            keys[0][0]
+            for keys, options in indexes
+            if "collation" not in options and keys[0][1] != "text"
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parts", [["Mic"], ["Pelosi"], ["Mary", "Jane", "Smith"]])
+    async def test_every_non_text_branch_is_indexed(self, member_indexes, parts):
+        """Each prefix branch must have a leading field on a usable index."""
+        await database.ensure_indexes()
+        usable = self._regex_usable(member_indexes)
+
+        for branch in _build_text_search_query(parts)["$or"]:
+            if "$text" in branch:
+                continue
+            assert any(field in usable for field in branch), branch
+
+
+class TestBuildTokenSearchQuery:
+    """Test the name_tokens backed query builder and its tokenizer."""
+
+    def test_tokenize_name(self):
+        """Tokens are lowercased, split on punctuation and de-duplicated."""
+        assert tokenize_name("Michael", "Bennet", "Bennet, Michael F.") == [
+            "bennet",
+            "f",
+            "michael",
+        ]
+
+    def test_two_words_match_all_tokens(self):
+        """Both words must be present in name_tokens, in any order."""
+        query = _build_token_search_query(["Lee", "Mike"])
+
+        assert query["$or"] == [
+            {"name_tokens": {"$all": ["lee", "mike"]}},
+            {"first_name": Regex("^Lee", "i"), "last_name": Regex("^Mike", "i")},
+        ]
+
+    def test_single_word_keeps_prefix_branches(self):
+        """Prefix searches ("Mic") still match through first/last name."""
+        query = _build_token_search_query(["Mic"])
+
+        assert query["$or"] == [
+            {"name_tokens": {"$all": ["mic"]}},
+            {"first_name": Regex("^Mic", "i")},
+            {"last_name": Regex("^Mic", "i")},
+        ]
+
+
+class TestNameFilterForParts:
+    """Test query routing for search_members' name filter."""
+
+    def test_routes_by_query_shape(self):
+        """Short words use regex, 1-2 words use tokens, longer use $text."""
+        assert _name_filter_for_parts(("Jo",)) == _build_name_search_query("Jo")
+        assert _name_filter_for_parts(("Mike", "Lee")) == _build_token_search_query(
+            ["Mike", "Lee"]
+        )
+        assert _name_filter_for_parts(
+            ("Mary", "Jane", "Smith")
+        ) == _build_text_search_query(["Mary", "Jane", "Smith"])
+
+    def test_repeated_queries_are_cached(self):
+        """Identical queries should return the memoized dict."""
+        assert _name_filter_for_parts(("Pelosi",)) is _name_filter_for_parts(
+            ("Pelosi",)
+        )
+
+
+class TestBuildAtlasSearchStage:
+    """Test the Atlas Search $search stage builder."""
+
+    def test_compound_should_covers_all_name_fields(self):
+        """Each word autocompletes on first/last name; the query hits name."""
+        stage = _build_atlas_search_stage("members_name", ["Mike", "Lee"])["$search"]
+
+        assert stage["index"] == "members_name"
+        assert stage["compound"]["minimumShouldMatch"] == 1
+        assert stage["compound"]["should"] == [
+            {"autocomplete": {"query": "Mike", "path": "first_name"}},
+            {"autocomplete": {"query": "Mike", "path": "last_name"}},
+            {"autocomplete": {"query": "Lee", "path": "first_name"}},
+            {"autocomplete": {"query": "Lee", "path": "last_name"}},
+            {"text": {"query": "Mike Lee", "path": "name"}},
+        ]
+
 
 class TestSearchMembersIntegration:
     """
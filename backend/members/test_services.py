@@ -0,0 +1,284 @@
+"""
+Unit tests for MemberService and the sync_members backfills.
+
+Tests that get_member shares one Congress API fetch between callers, that
+refreshes only invalidate cached listings when a member changed, and that
+legacy datetime updated_at values are read back as epoch seconds, and
+that sync_members backfills updated_at and name_tokens on older documents.
+"""
+
+import asyncio
+import io
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pymongo import UpdateOne
+
+from members import services
+from members.management.commands.sync_members import Command as SyncMembersCommand
+from members.models import Member
+from members.services import MemberService
+
+
+class _FakeCongressClient:
+    """Congress client returning one member after an optional delay."""
+
+    def __init__(self, name="Jane Smith", delay=0):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+
+    async def get_member(self, bioguide_id):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"bioguideId": bioguide_id, "name": self.name}
+
+    def transform_member(self, data):
+        return {"bioguide_id": data["bioguideId"], "name": data["name"]}
+
+
+class _FakeMembersCollection:
+    """In-memory members collection keyed by bioguide_id."""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one(self, query, projection=None):
+        doc = self.docs.get(query["bioguide_id"])
+        return dict(doc) if doc else None
+
+    async def find_one_and_update(self, query, update, **kwargs):
+        bioguide_id = query["bioguide_id"]
+        previous = self.docs.get(bioguide_id)
+        self.docs[bioguide_id] = {**(previous or {}), **update["$set"]}
+        return dict(previous) if previous else None
+
+
+@pytest.fixture
+def member_backend(monkeypatch):
+    """Patch the Congress client, collection and cache invalidation."""
+    backend = type("Backend", (), {})()
+    backend.client = _FakeCongressClient(delay=0.01)
+    backend.collection = _FakeMembersCollection()
+    backend.invalidations = 0
+
+    async def get_collection(name):
+        return backend.collection
+
+    def invalidate_caches():
+        backend.invalidations += 1
+
+    monkeypatch.setattr(services, "get_congress_client", lambda: backend.client)
+    monkeypatch.setattr(services, "get_collection", get_collection)
+    monkeypatch.setattr(MemberService, "invalidate_caches", invalidate_caches)
+    return backend
+
+
+class TestGetMemberCoalescing:
+    """Test the shared cold-miss fetch behind get_member."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, member_backend):
+        """Concurrent cold misses should make a single API call."""
+        results = await asyncio.gather(
+            *[MemberService.get_member("S000001") for _ in range(5)]
+        )
+
+        assert member_backend.client.calls == 1
+        assert [r["name"] for r in results] == ["Jane Smith"] * 5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_fetch(self, member_backend):
+        """One caller being cancelled should not fail the others."""
+        first = asyncio.create_task(MemberService.get_member("S000001"))
+        second = asyncio.create_task(MemberService.get_member("S000001"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+
+        assert result["name"] == "Jane Smith"
+        assert member_backend.client.calls == 1
+
+
+class TestFetchAndStoreInvalidation:
+    """Test that refreshes only drop caches when the member changed."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_refresh_keeps_caches(self, member_backend):
+        """Re-storing identical data (new updated_at only) keeps caches."""
+        await MemberService._fetch_and_store_member("S000001")
+        assert member_backend.invalidations == 1
+
+        await MemberService._fetch_and_store_member("S000001")
+        assert member_backend.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_refresh_invalidates(self, member_backend):
+        """A refresh that changes stored fields drops the caches."""
+        await MemberService._fetch_and_store_member("S000001")
+        member_backend.client.name = "Jane Q. Smith"
+
+        await MemberService._fetch_and_store_member("S000001")
+
+        assert member_backend.invalidations == 2
+        assert member_backend.collection.docs["S000001"]["name"] == "Jane Q. Smith"
+
+
+class TestLegacyUpdatedAt:
+    """Test reading members stored with a datetime updated_at."""
+
+    def test_model_coerces_datetime(self):
+        """Member accepts a legacy datetime and exposes epoch seconds."""
+        member = Member(
+            bioguide_id="S000001",
+            name="Jane Smith",
+            first_name="Jane",
+            last_name="Smith",
+            party="D",
+            state="CA",
+            chamber="house",
+            updated_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+
+        assert member.updated_at == 1704164645
+        assert "updated_at_iso" not in member.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_get_member_returns_epoch_seconds(self, member_backend):
+        """A legacy record is served as epoch seconds and refreshed."""
+        member_backend.collection.docs["S000001"] = {
+            "bioguide_id": "S000001",
+            "name": "Jane Smith",
+            "updated_at": datetime(2024, 1, 2, 3, 4, 5),
+        }
+
+        doc = await MemberService.get_member("S000001")
+        await asyncio.gather(*services._member_fetches.values())
+
+        assert doc["updated_at"] == 1704164645
+        assert member_backend.client.calls == 1
+        assert isinstance(member_backend.collection.docs["S000001"]["updated_at"], int)
+
+    @pytest.mark.asyncio
+    async def test_sync_members_backfills_epoch_seconds(self):
+        """sync_members converts only date-typed updated_at values."""
+        calls = []
+
+        class Collection:
+            async def update_many(self, query, update):
+                calls.append((query, update))
+                return SimpleNamespace(modified_count=3)
+
+        command = SyncMembersCommand(stdout=io.StringIO())
+        await command._backfill_updated_at(Collection())
+
+        assert calls == [
+            (
+                {"updated_at": {"$type": "date"}},
+                [
+                    {
+                        "$set": {
+                            "updated_at": {
+                                "$toLong": {
+                                    "$divide": [{"$toLong": "$updated_at"}, 1000]
+                                }
+                            }
+                        }
+                    }
+                ],
+            )
+        ]
+        assert command.stdout.getvalue() == "  Converted updated_at on 3 members\n"
+
+
+class _AsyncCursor:
+    """Async-iterable cursor over a fixed list of docs."""
+
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class TestNameTokensBackfill:
+    """Test the name_tokens backfill for members stored before the field."""
+
+    @pytest.mark.asyncio
+    async def test_sync_members_backfills_name_tokens(self):
+        """Members missing name_tokens get tokenize_name's tokens."""
+        calls = []
+
+        class Collection:
+            def find(self, query, projection):
+                calls.append(("find", query, projection))
+                return _AsyncCursor(
+                    [
+                        {
+                            "bioguide_id": "L000577",
+                            "first_name": "Mike",
+                            "last_name": "Lee",
+                            "name": "Mike S. Lee",
+                        },
+                        {"bioguide_id": "X000001", "first_name": None, "name": "Xi"},
+                    ]
+                )
+
+            async def bulk_write(self, ops, ordered=True):
+                calls.append(("bulk_write", ops, ordered))
+
+        command = SyncMembersCommand(stdout=io.StringIO())
+        await command._backfill_name_tokens(Collection())
+
+        assert calls == [
+            (
+                "find",
+                {"name_tokens": {"$exists": False}},
+                {
+                    "_id": 0,
+                    "bioguide_id": 1,
+                    "first_name": 1,
+                    "last_name": 1,
+                    "name": 1,
+                },
+            ),
+            (
+                "bulk_write",
+                [
+                    UpdateOne(
+                        {"bioguide_id": "L000577"},
+                        {"$set": {"name_tokens": ["lee", "mike", "s"]}},
+                    ),
+                    UpdateOne(
+                        {"bioguide_id": "X000001"},
+                        {"$set": {"name_tokens": ["xi"]}},
+                    ),
+                ],
+                False,
+            ),
+        ]
+        assert command.stdout.getvalue() == "  Backfilled name_tokens on 2 members\n"
+
+    @pytest.mark.asyncio
+    async def test_backfill_is_noop_when_all_tokenized(self):
+        """With no members missing tokens, nothing is written."""
+
+        class Collection:
+            def find(self, query, projection):
+                return _AsyncCursor([])
+
+            async def bulk_write(self, ops, ordered=True):
+                raise AssertionError("bulk_write should not be called")
+
+        command = SyncMembersCommand(stdout=io.StringIO())
+        await command._backfill_name_tokens(Collection())
+
+        assert command.stdout.getvalue() == ""
@@ -5,7 +5,8 @@ Member API views.
 import logging
 from typing import Optional
 
-from django.http import JsonResponse
+import msgspec
+from django.http import HttpResponse, JsonResponse
 from django.views import View
 
 from members.models import MemberSearchParams
@@ -13,6 +14,66 @@ from members.services import MemberService
 
 logger = logging.getLogger(__name__)
 
+# Shared msgspec encoder for member responses (list rows are Structs); error
+# responses stay on JsonResponse since they are off the hot path
+_json_encoder = msgspec.json.Encoder()
+
+# Bounds for pagination query parameters
+MAX_PAGE = 10_000
+MAX_PAGE_SIZE = 100  # MemberSearchParams.page_size upper bound
+MAX_LIMIT = 250  # Congress.gov API per-request maximum
+MAX_OFFSET = 100_000
+
+
+def _parse_int(value: Optional[str], default: int, lo: int, hi: int) -> int:
+    """
+    Parse an integer query parameter, clamped to [lo, hi].
+
+    Missing or non-numeric values fall back to default without raising, so
+    the common path never sets up exception handling.
+
+    Example:
+        >>> _parse_int("500", 20, 1, 100)
+        100
+        >>> _parse_int("abc", 20, 1, 100)
+        20
+    """
+    # Length cap keeps int() away from huge inputs (and its digit limit)
+    if value and len(value) <= 18 and value.removeprefix("-").isdecimal():
+        return min(hi, max(lo, int(value)))
+    return default
+
+
+def _json_response(data, status: int = 200) -> HttpResponse:
+    """Encode data with msgspec (compact, C-level) into a JSON response."""
+    return HttpResponse(
+        _json_encoder.encode(data), content_type="application/json", status=status
+    )
+
+
+# Encoded bodies for aggregate endpoints, keyed by endpoint. The service
+# returns the same cached object until its TTL expires, so the JSON is
+# re-encoded only when that object changes.
+_encoded_bodies: dict[str, tuple[object, bytes]] = {}
+
+
+def _cached_json_response(key: str, source: object, payload=None) -> HttpResponse:
+    """
+    Return a JSON response for source, reusing the bytes encoded last time.
+
+    Args:
+        key: Endpoint cache key
+        source: Cached service result (compared by identity)
+        payload: Optional zero-argument callable building the response body
+            from source; defaults to source itself
+    """
+    entry = _encoded_bodies.get(key)
+    if entry is None or entry[0] is not source:
+        body = payload() if payload else source
+        entry = (source, _json_encoder.encode(body))
+        _encoded_bodies[key] = entry
+    return HttpResponse(entry[1], content_type="application/json")
+
 
 class MemberListView(View):
     """
@@ -28,12 +89,14 @@ class MemberListView(View):
                 state=request.GET.get("state"),
                 party=request.GET.get("party"),
                 chamber=request.GET.get("chamber"),
-                page=int(request.GET.get("page", 1)),
-                page_size=int(request.GET.get("page_size", 20)),
+                page=_parse_int(request.GET.get("page"), 1, 1, MAX_PAGE),
+                page_size=_parse_int(
+                    request.GET.get("page_size"), 20, 1, MAX_PAGE_SIZE
+                ),
             )
 
             result = await MemberService.search_members(params)
-            return JsonResponse(result.model_dump())
+            return _json_response(result.model_dump())
 
         except ValueError as e:
             return JsonResponse({"error": str(e)}, status=400)
@@ -55,7 +118,7 @@ class MemberDetailView(View):
                 return JsonResponse(
                     {"error": f"Member {bioguide_id} not found"}, status=404
                 )
-            return JsonResponse(member)
+            return _json_response(member)
 
         except Exception as e:
             logger.exception(f"Error fetching member {bioguide_id}")
@@ -66,27 +129,38 @@ class MemberBillsView(View):
     """
     GET /api/v1/members/{bioguide_id}/bills/
     Get member's sponsored/cosponsored bills.
+
+    Query params:
+    - type: 'sponsored' (default), 'cosponsored', or 'both' (fetches the
+      two lists concurrently and returns them keyed by type)
     """
 
     async def get(self, request, bioguide_id: str):
         try:
             bill_type = request.GET.get("type", "sponsored")
-            if bill_type not in ("sponsored", "cosponsored"):
+            if bill_type not in ("sponsored", "cosponsored", "both"):
                 return JsonResponse(
-                    {"error": "type must be 'sponsored' or 'cosponsored'"}, status=400
+                    {"error": "type must be 'sponsored', 'cosponsored' or 'both'"},
+                    status=400,
                 )
 
-            limit = int(request.GET.get("limit", 20))
-            offset = int(request.GET.get("offset", 0))
+            limit = _parse_int(request.GET.get("limit"), 20, 1, MAX_LIMIT)
+            offset = _parse_int(request.GET.get("offset"), 0, 0, MAX_OFFSET)
+
+            if bill_type == "both":
+                result = await MemberService.get_member_bills_both(
+                    bioguide_id, limit=limit, offset=offset
+                )
+                return _json_response(result)
 
             result = await MemberService.get_member_bills(
                 bioguide_id, bill_type=bill_type, limit=limit, offset=offset
             )
 
             if "error" in result:
-                return JsonResponse(result, status=500)
+                return _json_response(result, status=500)
 
-            return JsonResponse(result)
+            return _json_response(result)
 
         except ValueError as e:
             return JsonResponse({"error": str(e)}, status=400)
@@ -103,17 +177,17 @@ class MemberAmendmentsView(View):
 
     async def get(self, request, bioguide_id: str):
         try:
-            limit = int(request.GET.get("limit", 20))
-            offset = int(request.GET.get("offset", 0))
+            limit = _parse_int(request.GET.get("limit"), 20, 1, MAX_LIMIT)
+            offset = _parse_int(request.GET.get("offset"), 0, 0, MAX_OFFSET)
 
             result = await MemberService.get_member_amendments(
                 bioguide_id, limit=limit, offset=offset
             )
 
             if "error" in result:
-                return JsonResponse(result, status=500)
+                return _json_response(result, status=500)
 
-            return JsonResponse(result)
+            return _json_response(result)
 
         except ValueError as e:
             return JsonResponse({"error": str(e)}, status=400)
@@ -131,7 +205,7 @@ class MemberStatsView(View):
     async def get(self, request):
         try:
             stats = await MemberService.get_member_stats()
-            return JsonResponse(stats)
+            return _cached_json_response("stats", stats)
         except Exception as e:
             logger.exception("Error fetching member stats")
             return JsonResponse({"error": "Internal server error"}, status=500)
@@ -146,7 +220,7 @@ class StatesView(View):
     async def get(self, request):
         try:
             states = await MemberService.get_states_with_members()
-            return JsonResponse({"states": states})
+            return _cached_json_response("states", states, lambda: {"states": states})
         except Exception as e:
             logger.exception("Error fetching states")
             return JsonResponse({"error": "Internal server error"}, status=500)
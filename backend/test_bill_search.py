@@ -3,31 +3,108 @@
 Quick test script for bill search functionality.
 
 Run with: python test_bill_search.py
+Or under pytest: pytest test_bill_search.py
+
+These are integration checks against a real MongoDB and the live Congress
+API; under pytest they are skipped unless both are available.
 """
 
 import asyncio
 import os
 import sys
+
 import django
+import pytest
+import pytest_asyncio
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 
 # Setup Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 sys.path.insert(0, os.path.dirname(__file__))
 django.setup()
 
+from django.conf import settings
+
 from bills.services import BillService
-from config.database import ensure_indexes
+from config.database import close_database, ensure_indexes
+
+
+def _integration_services_available() -> bool:
+    """True when a Congress API key is set and MongoDB answers a ping."""
+    if not settings.CONGRESS_API_KEY:
+        return False
+    # Short server selection so a missing database skips in about a second
+    # instead of waiting out the driver's 30s default
+    client = MongoClient(settings.MONGODB_URI, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+        return True
+    except PyMongoError:
+        return False
+    finally:
+        client.close()
+
+
+# One event loop for the module: the Motor client in config.database is
+# bound to the loop it was created on, so per-test loops would close it
+# out from under the second test
+pytestmark = [
+    pytest.mark.skipif(
+        not _integration_services_available(),
+        reason="needs MongoDB and CONGRESS_API_KEY",
+    ),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module", autouse=True)
+async def _module_database():
+    """Drop the shared Motor client before this module's loop closes."""
+    yield
+    await close_database()
+
+
+# ensure_indexes is idempotent; run it once per interpreter, not per test
+_INDEXES_READY = False
+
+
+async def _ensure_indexes_once():
+    """Create database indexes on first use only."""
+    global _INDEXES_READY
+    if not _INDEXES_READY:
+        await ensure_indexes()
+        _INDEXES_READY = True
+
+
+async def test_search_returns_paginated_results():
+    """Unfiltered search should sync if needed and return a page."""
+    await _ensure_indexes_once()
+    result = await BillService.search_bills(congress=119, page_size=5)
+
+    assert result["total"] >= len(result["results"])
+    assert len(result["results"]) <= 5
+    assert result["total_pages"] >= 1
+
+
+async def test_keyword_search():
+    """Keyword search should return at most one page of matches."""
+    await _ensure_indexes_once()
+    result = await BillService.search_bills(query="tax", congress=119, page_size=5)
+
+    assert len(result["results"]) <= 5
+    assert all("_id" not in bill for bill in result["results"])
 
 
-async def test_bill_search():
-    """Test the bill search functionality."""
+async def run_bill_search_checks():
+    """Run the bill search walkthrough, printing results."""
     print("=" * 60)
     print("Testing Bill Search API")
     print("=" * 60)
 
     # Ensure indexes are created
     print("\n1. Setting up database indexes...")
-    await ensure_indexes()
+    await _ensure_indexes_once()
     print("   ✓ Indexes created")
 
     # Test 1: Search without filters (should trigger sync)
@@ -97,4 +174,5 @@ async def test_bill_search():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_bill_search())
+    # One event loop for the whole walkthrough
+    asyncio.run(run_bill_search_checks())
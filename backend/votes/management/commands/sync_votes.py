@@ -9,18 +9,43 @@ Usage:
 """
 
 import asyncio
+import contextlib
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
+import httpx
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 from config.database import ensure_indexes, get_collection
 from members.clients.congress import get_congress_client
 from votes.xml_parser import SenateVoteXMLParser
 from votes.member_matcher import MemberMatcher
 
+try:
+    # Installed with uvicorn[standard]; faster loop for the concurrent sync
+    from uvloop import run as run_async
+except ImportError:
+    run_async = asyncio.run
+
 logger = logging.getLogger(__name__)
 
+# Votes fetched and stored concurrently within a batch
+VOTE_SYNC_CONCURRENCY = 10
+
+# vote_id prefix per chamber: {prefix}{congress}-{session}-{roll}
+CHAMBER_PREFIX = {"house": "h", "senate": "s"}
+
+# (our totals key, votePartyTotal field) pairs summed across parties
+VOTE_TOTAL_FIELDS = (
+    ("yea", "yeaTotal"),
+    ("nay", "nayTotal"),
+    ("present", "presentTotal"),
+    ("not_voting", "notVotingTotal"),
+)
+
 
 class Command(BaseCommand):
     help = "Sync recent votes from Congress.gov API"
@@ -62,10 +87,7 @@ class Command(BaseCommand):
         )
 
         # Run the async sync
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
-            self._sync_votes(chamber, congress, session, limit)
-        )
+        run_async(self._sync_votes(chamber, congress, session, limit))
 
     async def _sync_votes(
         self, chamber: str | None, congress: int, session: int, limit: int
@@ -76,6 +98,21 @@ class Command(BaseCommand):
 
         client = get_congress_client()
         collection = await get_collection("votes")
+        await self._backfill_voters(collection)
+
+        # One pooled, keep-alive HTTP client for all Senate XML fetches
+        xml_http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=VOTE_SYNC_CONCURRENCY,
+                max_keepalive_connections=VOTE_SYNC_CONCURRENCY,
+            ),
+        )
+        self.xml_parser = SenateVoteXMLParser(
+            client=xml_http_client, cache_dir=settings.SENATE_XML_CACHE_DIR
+        )
+        # One matcher per run: it loads senators once and reuses them per vote
+        self.matcher = MemberMatcher()
 
         total_synced = 0
         total_errors = 0
@@ -103,6 +140,7 @@ class Command(BaseCommand):
                 f"  ✓ Synced {synced} {chamber_name} votes, {errors} errors"
             )
 
+        await xml_http_client.aclose()
         await client.close()
 
         # Summary
@@ -113,6 +151,35 @@ class Command(BaseCommand):
             )
         )
 
+    async def _backfill_voters(self, collection):
+        """
+        Add the indexed voters array to votes stored before it existed.
+
+        Idempotent: only documents missing the field are touched, so after
+        the first run this is a no-op index lookup.
+        """
+        result = await collection.update_many(
+            {"voters": {"$exists": False}},
+            [
+                {
+                    "$set": {
+                        "voters": {
+                            "$map": {
+                                "input": {
+                                    "$objectToArray": {
+                                        "$ifNull": ["$member_votes", {}]
+                                    }
+                                },
+                                "in": "$$this.k",
+                            }
+                        }
+                    }
+                }
+            ],
+        )
+        if result.modified_count:
+            self.stdout.write(f"  Backfilled voters on {result.modified_count} votes")
+
     async def _sync_chamber_votes(
         self,
         client,
@@ -127,78 +194,196 @@ class Command(BaseCommand):
         errors = 0
         offset = 0
         page_size = 100  # Fetch 100 at a time
+        semaphore = asyncio.Semaphore(VOTE_SYNC_CONCURRENCY)
 
-        while synced < limit:
-            try:
-                # Fetch a batch of votes
-                if chamber == "house":
-                    data = await client.get_house_votes(
-                        congress, session, limit=min(page_size, limit - synced), offset=offset
+        # The next list page is fetched while the current batch's details
+        # are fetched and stored
+        next_page = asyncio.create_task(
+            self._fetch_vote_page(
+                client, chamber, congress, session, min(page_size, limit), offset
+            )
+        )
+
+        try:
+            while next_page is not None:
+                try:
+                    votes = await next_page
+                    next_page = None
+
+                    if not votes:
+                        break
+
+                    self.stdout.write(
+                        f"  Processing batch: offset={offset}, count={len(votes)}"
                     )
-                else:
-                    data = await client.get_senate_votes(
-                        congress, session, limit=min(page_size, limit - synced), offset=offset
+
+                    offset += len(votes)
+                    # Assume the batch stores fully; a short batch is topped up
+                    # by the next page
+                    remaining = limit - synced - len(votes)
+                    if remaining > 0:
+                        next_page = asyncio.create_task(
+                            self._fetch_vote_page(
+                                client,
+                                chamber,
+                                congress,
+                                session,
+                                min(page_size, remaining),
+                                offset,
+                            )
+                        )
+
+                    # One updated_at timestamp for the whole batch
+                    now = datetime.now(timezone.utc)
+
+                    # Fetch the batch concurrently; each vote is 1-2 API round
+                    # trips, so a serial loop is latency-bound
+                    results = await asyncio.gather(
+                        *[
+                            self._process_vote(
+                                semaphore,
+                                client,
+                                chamber,
+                                congress,
+                                session,
+                                vote_data,
+                                now,
+                            )
+                            for vote_data in votes
+                        ],
+                        return_exceptions=True,
                     )
 
-                # Get votes from response (different keys for House vs Senate)
-                if chamber == "house":
-                    votes = data.get("houseRollCallVotes", [])
-                else:
-                    votes = data.get("senateRollCallVotes", [])
+                    pending_ops: list[UpdateOne] = []
+                    for result in results:
+                        if isinstance(result, UpdateOne):
+                            pending_ops.append(result)
+                        elif result is False:
+                            errors += 1
+                        elif isinstance(result, Exception):
+                            logger.error(f"Error syncing vote: {result}")
+                            errors += 1
+
+                    # Store the whole batch in one unordered bulk write
+                    stored, failed = await self._flush_votes(collection, pending_ops)
+                    synced += stored
+                    errors += failed
+
+                    self.stdout.write(f"    ... {synced} votes synced")
+
+                    # Break if we've synced enough
+                    if synced >= limit:
+                        break
+
+                    if next_page is None:
+                        # Some votes failed; fetch more to reach the limit
+                        next_page = asyncio.create_task(
+                            self._fetch_vote_page(
+                                client,
+                                chamber,
+                                congress,
+                                session,
+                                min(page_size, limit - synced),
+                                offset,
+                            )
+                        )
 
-                if not votes:
+                except Exception as e:
+                    logger.error(f"Error fetching vote batch: {e}")
+                    errors += 1
                     break
 
-                self.stdout.write(
-                    f"  Processing batch: offset={offset}, count={len(votes)}"
-                )
+        finally:
+            # Don't leave a prefetch running (or its error unretrieved) when
+            # the loop ends early or is interrupted
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_page
 
-                # Process each vote
-                for vote_data in votes:
-                    try:
-                        roll_number = vote_data.get("rollCallNumber")
-                        if not roll_number:
-                            continue
+        return synced, errors
 
-                        # Get sourceDataURL for Senate votes (XML)
-                        source_url = vote_data.get("sourceDataURL")
+    async def _fetch_vote_page(
+        self,
+        client,
+        chamber: str,
+        congress: int,
+        session: int,
+        limit: int,
+        offset: int,
+    ) -> list[dict]:
+        """Fetch one page of a chamber's roll call vote list."""
+        if chamber == "house":
+            data = await client.get_house_votes(
+                congress, session, limit=limit, offset=offset
+            )
+            # Different response keys for House vs Senate
+            return data.get("houseRollCallVotes", [])
 
-                        # Fetch detailed vote with member votes
-                        detailed_vote = await self._fetch_detailed_vote(
-                            client, chamber, congress, session, roll_number, source_url
-                        )
+        data = await client.get_senate_votes(
+            congress, session, limit=limit, offset=offset
+        )
+        return data.get("senateRollCallVotes", [])
 
-                        if not detailed_vote:
-                            errors += 1
-                            continue
+    async def _flush_votes(
+        self, collection, pending_ops: list[UpdateOne]
+    ) -> tuple[int, int]:
+        """
+        Write pending vote upserts with one unordered bulk_write.
 
-                        # Transform and store
-                        await self._store_vote(
-                            collection, detailed_vote, chamber, congress, session, roll_number
-                        )
+        Returns:
+            (stored, failed) counts
+        """
+        if not pending_ops:
+            return 0, 0
 
-                        synced += 1
+        try:
+            await collection.bulk_write(pending_ops, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: everything except the reported failures was applied
+            failed = len(e.details.get("writeErrors", []))
+            logger.error(f"{failed} vote upserts failed: {e}")
+            return len(pending_ops) - failed, failed
 
-                        # Progress indicator
-                        if synced % 10 == 0:
-                            self.stdout.write(f"    ... {synced} votes synced")
+        return len(pending_ops), 0
 
-                    except Exception as e:
-                        logger.error(f"Error syncing vote: {e}")
-                        errors += 1
+    async def _process_vote(
+        self,
+        semaphore: asyncio.Semaphore,
+        client,
+        chamber: str,
+        congress: int,
+        session: int,
+        vote_data: dict,
+        updated_at: datetime,
+    ) -> UpdateOne | bool | None:
+        """
+        Fetch one vote and build its upsert.
+
+        Returns:
+            UpdateOne to store the vote, False on error, None if skipped
+            (no roll number)
+        """
+        roll_number = vote_data.get("rollCallNumber")
+        if not roll_number:
+            return None
 
-                offset += len(votes)
+        # Get sourceDataURL for Senate votes (XML)
+        source_url = vote_data.get("sourceDataURL")
 
-                # Break if we've synced enough
-                if synced >= limit:
-                    break
+        async with semaphore:
+            # Fetch detailed vote with member votes
+            detailed_vote = await self._fetch_detailed_vote(
+                client, chamber, congress, session, roll_number, source_url
+            )
 
-            except Exception as e:
-                logger.error(f"Error fetching vote batch: {e}")
-                errors += 1
-                break
+        if not detailed_vote:
+            return False
 
-        return synced, errors
+        # Transform; the caller stores the batch
+        return self._build_vote_upsert(
+            detailed_vote, chamber, congress, session, roll_number, updated_at
+        )
 
     async def _fetch_detailed_vote(
         self, client, chamber: str, congress: int, session: int, roll_number: int,
@@ -207,12 +392,22 @@ class Command(BaseCommand):
         """Fetch detailed vote information including member votes."""
         try:
             if chamber == "house":
-                # House votes: Use JSON API
-                vote_data = await client.get_house_vote(congress, session, roll_number)
+                # House votes: Use JSON API. Vote metadata and member votes
+                # are independent requests, so fetch them concurrently; both
+                # are awaited to completion even when one fails
+                vote_data, members_data = await asyncio.gather(
+                    client.get_house_vote(congress, session, roll_number),
+                    client.get_house_vote_members(congress, session, roll_number),
+                    return_exceptions=True,
+                )
+                for result in (vote_data, members_data):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Failed to fetch House vote {roll_number}: {result}"
+                        )
+                        return None
                 vote = vote_data.get("houseRollCallVote", vote_data)
 
-                # Fetch member votes separately
-                members_data = await client.get_house_vote_members(congress, session, roll_number)
                 members_response = members_data.get("houseRollCallVoteMemberVotes", {})
 
                 # Combine vote metadata with member votes
@@ -235,18 +430,16 @@ class Command(BaseCommand):
                     logger.error(f"No sourceDataURL for Senate vote {roll_number}")
                     return None
 
-                parser = SenateVoteXMLParser()
-                xml_data = await parser.fetch_and_parse(source_url)
+                xml_data = await self.xml_parser.fetch_and_parse(source_url)
 
                 if not xml_data:
                     return None
 
                 # Match Senate members to bioguide IDs
-                matcher = MemberMatcher()
                 matched_members = []
 
                 for member in xml_data.get("members", []):
-                    bioguide_id = await matcher.match_senate_member(member)
+                    bioguide_id = await self.matcher.match_senate_member(member)
 
                     if bioguide_id:
                         matched_members.append({
@@ -288,42 +481,36 @@ class Command(BaseCommand):
             )
             return None
 
-    async def _store_vote(
+    def _build_vote_upsert(
         self,
-        collection,
         vote_data: dict,
         chamber: str,
         congress: int,
         session: int,
         roll_number: int,
-    ):
-        """Transform and store vote in MongoDB."""
-        vote_id = f"{'h' if chamber == 'house' else 's'}{congress}-{session}-{roll_number}"
+        updated_at: datetime,
+    ) -> UpdateOne:
+        """Transform a vote into an upsert operation for bulk_write."""
+        vote_id = f"{CHAMBER_PREFIX[chamber]}{congress}-{session}-{roll_number}"
 
         # Transform vote data
         transformed = self._transform_vote(
-            vote_data, chamber, congress, session, roll_number
+            vote_data, vote_id, chamber, congress, session, roll_number
         )
-        transformed["updated_at"] = datetime.utcnow()
+        transformed["updated_at"] = updated_at
 
-        # Upsert to database
-        await collection.update_one(
-            {"vote_id": vote_id},
-            {"$set": transformed},
-            upsert=True,
-        )
+        return UpdateOne({"vote_id": vote_id}, {"$set": transformed}, upsert=True)
 
     def _transform_vote(
         self,
         vote_data: dict,
+        vote_id: str,
         chamber: str,
         congress: int,
         session: int,
         roll_number: int,
     ) -> dict:
         """Transform API vote data to our schema."""
-        vote_id = f"{'h' if chamber == 'house' else 's'}{congress}-{session}-{roll_number}"
-
         # Extract member votes (now populated by _fetch_detailed_vote)
         member_votes = {}
         for member_data in vote_data.get("members", []):
@@ -334,16 +521,10 @@ class Command(BaseCommand):
 
         # Calculate totals from votePartyTotal array
         party_totals = vote_data.get("votePartyTotal", [])
-        total_yea = 0
-        total_nay = 0
-        total_present = 0
-        total_not_voting = 0
-
-        for party_total in party_totals:
-            total_yea += party_total.get("yeaTotal", 0)
-            total_nay += party_total.get("nayTotal", 0)
-            total_present += party_total.get("presentTotal", 0)
-            total_not_voting += party_total.get("notVotingTotal", 0)
+        totals = {
+            key: sum(party_total.get(source, 0) for party_total in party_totals)
+            for key, source in VOTE_TOTAL_FIELDS
+        }
 
         # Extract bill/legislation information (if present)
         bill_id = None
@@ -375,11 +556,8 @@ class Command(BaseCommand):
             "description": vote_data.get("description"),
             "result": vote_data.get("result"),
             "bill_id": bill_id,
-            "totals": {
-                "yea": total_yea,
-                "nay": total_nay,
-                "present": total_present,
-                "not_voting": total_not_voting,
-            },
+            "totals": totals,
             "member_votes": member_votes,
+            # Indexed (multikey) list of who voted, for member vote lookups
+            "voters": list(member_votes),
         }
@@ -4,6 +4,7 @@ Member matching utilities for linking external data to our database.
 Handles matching members from various sources (Senate XML, etc.) to bioguide IDs.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -13,10 +14,61 @@ logger = logging.getLogger(__name__)
 
 
 class MemberMatcher:
-    """Match member records from external sources to bioguide IDs."""
+    """
+    Match member records from external sources to bioguide IDs.
+
+    Members of a chamber are loaded from MongoDB once, on first lookup, into
+    in-memory maps, so each match is a dict lookup instead of 1-2 regex
+    queries per senator per vote.
+
+    The maps are deliberately not persisted between runs: the load is a
+    single projected query per chamber, and rebuilding it each run picks up
+    membership changes from sync_members without any invalidation.
+    """
 
     def __init__(self):
-        self._member_cache = {}
+        # (first, last, state, chamber), lowercased/upper-state -> bioguide_id
+        self._by_full_name: dict[tuple[str, str, str, str], str] = {}
+        # (state, chamber) -> [(last_name_lower, bioguide_id), ...]
+        self._by_state: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        self._loaded_chambers: set[str] = set()
+        self._load_lock = asyncio.Lock()
+
+    async def _ensure_loaded(self, chamber: str):
+        """Load all members of a chamber into the lookup maps (once)."""
+        if chamber in self._loaded_chambers:
+            return
+
+        async with self._load_lock:
+            if chamber in self._loaded_chambers:
+                return
+
+            collection = await get_collection("members")
+            members = await collection.find(
+                {"chamber": chamber},
+                {
+                    "_id": 0,
+                    "bioguide_id": 1,
+                    "first_name": 1,
+                    "last_name": 1,
+                    "state": 1,
+                },
+            ).to_list(length=None)
+
+            for member in members:
+                first = (member.get("first_name") or "").lower()
+                last = (member.get("last_name") or "").lower()
+                state = (member.get("state") or "").upper()
+                bioguide_id = member.get("bioguide_id")
+                # Keep the first record on duplicates, like find_one did
+                key = (first, last, state, chamber)
+                self._by_full_name.setdefault(key, bioguide_id)
+                self._by_state.setdefault((state, chamber), []).append(
+                    (last, bioguide_id)
+                )
+
+            self._loaded_chambers.add(chamber)
+            logger.debug(f"Loaded {len(members)} {chamber} members for matching")
 
     async def find_bioguide_by_name_state(
         self, first_name: str, last_name: str, state: str, chamber: str = "senate"
@@ -35,56 +87,34 @@ class MemberMatcher:
         Returns:
             Bioguide ID if found, None otherwise
         """
-        # Create cache key
-        cache_key = f"{last_name}_{first_name}_{state}_{chamber}".lower()
-
-        # Check cache first
-        if cache_key in self._member_cache:
-            return self._member_cache[cache_key]
+        chamber = chamber.lower()
+        state = state.upper()
+        first = first_name.lower()
+        last = last_name.lower()
 
         try:
-            collection = await get_collection("members")
-
-            # Try exact match first
-            member = await collection.find_one(
-                {
-                    "first_name": {"$regex": f"^{first_name}$", "$options": "i"},
-                    "last_name": {"$regex": f"^{last_name}$", "$options": "i"},
-                    "state": state.upper(),
-                    "chamber": chamber.lower(),
-                }
-            )
-
-            if member:
-                bioguide_id = member.get("bioguide_id")
-                self._member_cache[cache_key] = bioguide_id
-                return bioguide_id
+            await self._ensure_loaded(chamber)
+        except Exception as e:
+            logger.error(f"Error finding bioguide ID: {e}")
+            return None
 
-            # Try partial match on last name (handles Jr., III, etc.)
-            member = await collection.find_one(
-                {
-                    "last_name": {"$regex": f"^{last_name}", "$options": "i"},
-                    "state": state.upper(),
-                    "chamber": chamber.lower(),
-                }
-            )
+        # Try exact match first (case-insensitive)
+        bioguide_id = self._by_full_name.get((first, last, state, chamber))
+        if bioguide_id:
+            return bioguide_id
 
-            if member:
-                bioguide_id = member.get("bioguide_id")
+        # Try partial match on last name (handles Jr., III, etc.)
+        for stored_last, bioguide_id in self._by_state.get((state, chamber), []):
+            if stored_last.startswith(last):
                 logger.info(
                     f"Partial match for {first_name} {last_name} ({state}): {bioguide_id}"
                 )
-                self._member_cache[cache_key] = bioguide_id
                 return bioguide_id
 
-            logger.warning(
-                f"Could not find bioguide ID for {first_name} {last_name} ({state})"
-            )
-            return None
-
-        except Exception as e:
-            logger.error(f"Error finding bioguide ID: {e}")
-            return None
+        logger.warning(
+            f"Could not find bioguide ID for {first_name} {last_name} ({state})"
+        )
+        return None
 
     async def match_senate_member(self, member_data: dict) -> Optional[str]:
         """
@@ -104,5 +134,7 @@ class MemberMatcher:
         )
 
     def clear_cache(self):
-        """Clear the member matching cache."""
-        self._member_cache.clear()
+        """Clear the loaded members; the next lookup reloads them."""
+        self._by_full_name.clear()
+        self._by_state.clear()
+        self._loaded_chambers.clear()
@@ -1,5 +1,8 @@
 """
 Pydantic models for congressional votes.
+
+These document the API schema. The sync command and VoteService read and
+write plain dicts, so no per-vote validation runs on the hot paths.
 """
 
 from datetime import date, datetime
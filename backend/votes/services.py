@@ -2,15 +2,39 @@
 Vote service layer - business logic for vote operations.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
 
+from config.cache import AsyncTTLCache
 from config.database import get_collection
 from members.clients.congress import get_congress_client
 
 logger = logging.getLogger(__name__)
 
+# Per-member vote counts for get_member_votes, keyed by (bioguide_id, chamber).
+# Votes only change when sync_votes runs (in its own process), so a short TTL
+# bounds staleness while pages after the first skip count_documents.
+# Keys come straight from the request path, so bound the number kept.
+MEMBER_VOTE_COUNT_TTL = 300  # seconds
+MEMBER_VOTE_COUNT_CACHE_SIZE = 1024
+_member_vote_count_cache = AsyncTTLCache(
+    ttl=MEMBER_VOTE_COUNT_TTL, maxsize=MEMBER_VOTE_COUNT_CACHE_SIZE
+)
+
+# Votes fetched from the Congress API by get_vote, keyed by vote_id, so
+# repeated misses that race the Mongo upsert don't re-hit the API
+REMOTE_VOTE_CACHE_TTL = 60  # seconds
+REMOTE_VOTE_CACHE_SIZE = 1024
+_remote_vote_cache = AsyncTTLCache(
+    ttl=REMOTE_VOTE_CACHE_TTL, maxsize=REMOTE_VOTE_CACHE_SIZE
+)
+
+# In-flight fetch-and-store tasks keyed by vote_id; concurrent requests for
+# the same uncached vote share one API call and one upsert
+_vote_fetches: dict[str, asyncio.Task] = {}
+
 
 class VoteService:
     """Service for vote-related operations."""
@@ -27,10 +51,11 @@ class VoteService:
         """
         collection = await get_collection("votes")
 
-        # Check local database first
-        doc = await collection.find_one({"vote_id": vote_id})
+        # Check local database first; voters is an internal index field
+        doc = await collection.find_one(
+            {"vote_id": vote_id}, {"_id": 0, "voters": 0}
+        )
         if doc:
-            doc.pop("_id", None)
             return doc
 
         # Parse vote_id
@@ -55,18 +80,53 @@ class VoteService:
         except (ValueError, IndexError):
             return None
 
-        # Fetch from API
-        try:
-            client = get_congress_client()
-            if chamber == "house":
-                data = await client.get_house_vote(congress, session, roll_number)
-            else:
-                data = await client.get_senate_vote(congress, session, roll_number)
+        # Fetch from API; shield the shared task so one caller going away
+        # doesn't cancel it for the others
+        task = VoteService._schedule_vote_fetch(
+            vote_id, chamber, congress, session, roll_number
+        )
+        vote_data = await asyncio.shield(task)
+
+        if not vote_data:
+            return None
+
+        # Callers get their own copy of the shared dict, shaped like the
+        # stored-vote response above
+        vote = dict(vote_data)
+        vote.pop("voters", None)
+        return vote
+
+    @staticmethod
+    def _schedule_vote_fetch(
+        vote_id: str, chamber: str, congress: int, session: int, roll_number: int
+    ) -> asyncio.Task:
+        """Start (or join) the fetch-and-store for a vote and return its task."""
+        task = _vote_fetches.get(vote_id)
+        if task is None:
+            task = asyncio.create_task(
+                VoteService._fetch_and_store_vote(
+                    vote_id, chamber, congress, session, roll_number
+                )
+            )
+            _vote_fetches[vote_id] = task
+            task.add_done_callback(lambda _: _vote_fetches.pop(vote_id, None))
+        return task
 
-            vote_data = VoteService._transform_vote(data, chamber, congress, session, roll_number)
-            vote_data["updated_at"] = datetime.utcnow()
+    @staticmethod
+    async def _fetch_and_store_vote(
+        vote_id: str, chamber: str, congress: int, session: int, roll_number: int
+    ) -> Optional[dict]:
+        """Fetch a vote from the Congress API and upsert it locally."""
+        try:
+            vote_data = await _remote_vote_cache.get_or_load(
+                vote_id,
+                lambda: VoteService._fetch_remote_vote(
+                    chamber, congress, session, roll_number
+                ),
+            )
 
             # Store in database
+            collection = await get_collection("votes")
             await collection.update_one(
                 {"vote_id": vote_id},
                 {"$set": vote_data},
@@ -78,6 +138,21 @@ class VoteService:
             logger.error(f"Failed to fetch vote {vote_id}: {e}")
             return None
 
+    @staticmethod
+    async def _fetch_remote_vote(
+        chamber: str, congress: int, session: int, roll_number: int
+    ) -> dict:
+        """Fetch a vote from the Congress API and transform it."""
+        client = get_congress_client()
+        if chamber == "house":
+            data = await client.get_house_vote(congress, session, roll_number)
+        else:
+            data = await client.get_senate_vote(congress, session, roll_number)
+
+        vote_data = VoteService._transform_vote(data, chamber, congress, session, roll_number)
+        vote_data["updated_at"] = datetime.utcnow()
+        return vote_data
+
     @staticmethod
     def _transform_vote(
         data: dict,
@@ -112,6 +187,7 @@ class VoteService:
                 "not_voting": totals.get("notVoting", 0) or totals.get("not_voting", 0),
             },
             "member_votes": {},  # Member votes need separate fetch
+            "voters": [],
         }
 
     @staticmethod
@@ -133,45 +209,91 @@ class VoteService:
         congress: int = 118,
         limit: int = 20,
         offset: int = 0,
+        before: Optional[str] = None,
+        before_id: Optional[str] = None,
     ) -> dict:
         """
         Get voting record for a member.
 
         Note: Congress.gov API doesn't have a direct endpoint for member votes.
         This queries our local cache of votes.
+
+        Pages can be walked with offset, or with before/before_id (keyset
+        pagination): pass the date and vote_id of the previous page's
+        next_before to get the votes after it in (date, vote_id) order
+        without the server skipping over offset index entries.
         """
         collection = await get_collection("votes")
 
-        query = {f"member_votes.{bioguide_id}": {"$exists": True}}
+        # voters is a multikey-indexed copy of member_votes' keys, so this
+        # is an index lookup instead of a $exists scan over every vote
+        query = {"voters": bioguide_id}
         if chamber:
             query["chamber"] = chamber.lower()
-
-        total = await collection.count_documents(query)
-
+        count_query = dict(query)
+        if before and before_id:
+            # Votes on the same date as the cursor are ordered by vote_id,
+            # so ties at a page boundary are neither skipped nor repeated
+            query["$or"] = [
+                {"date": {"$lt": before}},
+                {"date": before, "vote_id": {"$lt": before_id}},
+            ]
+        elif before:
+            query["date"] = {"$lt": before}
+
+        # Only this member's entry of member_votes (up to ~435 keys per doc)
+        projection = {
+            "_id": 0,
+            "vote_id": 1,
+            "date": 1,
+            "question": 1,
+            "bill_id": 1,
+            "result": 1,
+            f"member_votes.{bioguide_id}": 1,
+        }
         cursor = (
-            collection.find(query)
-            .sort("date", -1)
+            collection.find(query, projection)
+            .sort([("date", -1), ("vote_id", -1)])
             .skip(offset)
-            .limit(limit)
+            .limit(limit + 1)
+            .batch_size(limit + 1)
         )
 
-        results = []
-        async for doc in cursor:
-            member_vote = doc.get("member_votes", {}).get(bioguide_id, "Unknown")
-            results.append(
-                {
-                    "vote_id": doc["vote_id"],
-                    "date": doc.get("date"),
-                    "question": doc.get("question", ""),
-                    "bill_id": doc.get("bill_id"),
-                    "member_vote": member_vote,
-                    "result": doc.get("result"),
-                }
+        # Fetch the whole page plus one extra doc to detect a next page
+        docs = await cursor.to_list(length=limit + 1)
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+
+        if offset == 0 and not before and not has_more:
+            # The whole record fits on the first page
+            total = len(docs)
+        else:
+            total = await _member_vote_count_cache.get_or_load(
+                (bioguide_id, count_query.get("chamber")),
+                lambda: collection.count_documents(count_query),
             )
+        results = [
+            {
+                "vote_id": doc["vote_id"],
+                "date": doc.get("date"),
+                "question": doc.get("question", ""),
+                "bill_id": doc.get("bill_id"),
+                "member_vote": doc.get("member_votes", {}).get(bioguide_id, "Unknown"),
+                "result": doc.get("result"),
+            }
+            for doc in docs
+        ]
+
+        next_before = None
+        if has_more and docs:
+            last = docs[-1]
+            next_before = {"date": last.get("date"), "vote_id": last["vote_id"]}
 
         return {
             "results": results,
             "total": total,
+            "has_more": has_more,
+            "next_before": next_before,
         }
 
     @staticmethod
@@ -0,0 +1,158 @@
+"""
+Unit tests for MemberMatcher.
+
+Tests that a chamber's members are loaded once and matched in memory
+against a fake members collection.
+"""
+
+import pytest
+
+from votes import member_matcher
+from votes.member_matcher import MemberMatcher
+
+SENATORS = [
+    {
+        "bioguide_id": "B001230",
+        "first_name": "Tammy",
+        "last_name": "Baldwin",
+        "state": "WI",
+    },
+    {
+        "bioguide_id": "B001261",
+        "first_name": "John",
+        "last_name": "Barrasso",
+        "state": "WY",
+    },
+    {
+        "bioguide_id": "K000383",
+        "first_name": "Angus",
+        "last_name": "King Jr.",
+        "state": "ME",
+    },
+    {
+        "bioguide_id": "C001035",
+        "first_name": "Susan",
+        "last_name": "Collins",
+        "state": "ME",
+    },
+]
+
+
+class _FakeCursor:
+    """Cursor returning a fixed list of docs."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, length):
+        return list(self._docs)
+
+
+class _FakeMembersCollection:
+    """Members collection recording each find() query."""
+
+    def __init__(self, docs, error=None):
+        self.docs = docs
+        self.error = error
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append((query, projection))
+        if self.error is not None:
+            raise self.error
+        return _FakeCursor(self.docs)
+
+
+@pytest.fixture
+def members_collection(monkeypatch):
+    """Serve SENATORS as the senate members."""
+    collection = _FakeMembersCollection(SENATORS)
+
+    async def get_collection(name):
+        assert name == "members"
+        return collection
+
+    monkeypatch.setattr(member_matcher, "get_collection", get_collection)
+    return collection
+
+
+class TestMemberMatcher:
+    """Test preloading and name/state matching."""
+
+    @pytest.mark.asyncio
+    async def test_chamber_loaded_once(self, members_collection):
+        """Every lookup after the first is served from memory."""
+        matcher = MemberMatcher()
+
+        for senator in SENATORS * 3:
+            await matcher.match_senate_member(senator)
+
+        assert members_collection.queries == [
+            (
+                {"chamber": "senate"},
+                {
+                    "_id": 0,
+                    "bioguide_id": 1,
+                    "first_name": 1,
+                    "last_name": 1,
+                    "state": 1,
+                },
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_exact_match_ignores_case(self, members_collection):
+        """First name, last name and state match case-insensitively."""
+        matcher = MemberMatcher()
+
+        bioguide_id = await matcher.match_senate_member(
+            {"first_name": "TAMMY", "last_name": "baldwin", "state": "wi"}
+        )
+
+        assert bioguide_id == "B001230"
+
+    @pytest.mark.asyncio
+    async def test_partial_last_name_within_state(self, members_collection):
+        """A suffix-less last name matches a stored name with a suffix."""
+        matcher = MemberMatcher()
+
+        bioguide_id = await matcher.match_senate_member(
+            {"first_name": "Angus S.", "last_name": "King", "state": "ME"}
+        )
+
+        assert bioguide_id == "K000383"
+
+    @pytest.mark.asyncio
+    async def test_unknown_member_is_none(self, members_collection):
+        """No exact or same-state partial match returns None."""
+        matcher = MemberMatcher()
+
+        assert (
+            await matcher.match_senate_member(
+                {"first_name": "Tammy", "last_name": "Baldwin", "state": "MN"}
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_reloads(self, members_collection):
+        """clear_cache() makes the next lookup query the collection again."""
+        matcher = MemberMatcher()
+        await matcher.match_senate_member(SENATORS[0])
+
+        matcher.clear_cache()
+        await matcher.match_senate_member(SENATORS[0])
+
+        assert len(members_collection.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_load_error_is_none(self, monkeypatch):
+        """A failed load is logged and reported as no match."""
+        collection = _FakeMembersCollection([], error=RuntimeError("db down"))
+
+        async def get_collection(name):
+            return collection
+
+        monkeypatch.setattr(member_matcher, "get_collection", get_collection)
+
+        assert await MemberMatcher().match_senate_member(SENATORS[0]) is None
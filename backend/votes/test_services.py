@@ -0,0 +1,159 @@
+"""
+Unit tests for the vote service layer.
+
+Tests keyset pagination in VoteService.get_member_votes against an
+in-memory collection that applies the same filter and sort as MongoDB.
+"""
+
+import pytest
+
+from votes import services
+from votes.services import VoteService
+
+
+def _matches(doc, query):
+    """Evaluate the subset of MongoDB query syntax get_member_votes uses."""
+    for field, cond in query.items():
+        if field == "$or":
+            if not any(_matches(doc, branch) for branch in cond):
+                return False
+        elif field == "voters":
+            if cond not in doc.get("voters", []):
+                return False
+        elif isinstance(cond, dict):
+            if not doc.get(field) < cond["$lt"]:
+                return False
+        elif doc.get(field) != cond:
+            return False
+    return True
+
+
+class _FakeCursor:
+    """Cursor over a list of docs supporting sort/skip/limit/batch_size."""
+
+    def __init__(self, docs):
+        self._docs = docs
+        self._skip = 0
+        self._limit = None
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self._docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self._skip = n
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def batch_size(self, n):
+        return self
+
+    async def to_list(self, length):
+        return self._docs[self._skip :][: self._limit][:length]
+
+
+class _FakeVotesCollection:
+    """In-memory stand-in for the votes collection."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        return _FakeCursor([dict(doc) for doc in self.docs if _matches(doc, query)])
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs if _matches(doc, query))
+
+
+def _vote(vote_id, date):
+    return {
+        "vote_id": vote_id,
+        "date": date,
+        "question": "On Passage",
+        "bill_id": None,
+        "result": "Passed",
+        "member_votes": {"A000001": "Yea"},
+        "voters": ["A000001"],
+    }
+
+
+@pytest.fixture
+def votes_collection(monkeypatch):
+    """Seven votes, five of them on one date so ties straddle page breaks."""
+    collection = _FakeVotesCollection(
+        [
+            _vote("h118-1-10", "2024-03-02"),
+            _vote("h118-1-11", "2024-03-01"),
+            _vote("h118-1-12", "2024-03-01"),
+            _vote("h118-1-13", "2024-03-01"),
+            _vote("h118-1-14", "2024-03-01"),
+            _vote("h118-1-15", "2024-03-01"),
+            _vote("h118-1-16", "2024-02-28"),
+        ]
+    )
+
+    async def get_collection(name):
+        return collection
+
+    monkeypatch.setattr(services, "get_collection", get_collection)
+    services._member_vote_count_cache.invalidate()
+    yield collection
+    services._member_vote_count_cache.invalidate()
+
+
+class TestMemberVotesKeysetPagination:
+    """Test the (date, vote_id) cursor returned as next_before."""
+
+    async def _walk(self, limit):
+        seen = []
+        before = {}
+        while True:
+            page = await VoteService.get_member_votes(
+                "A000001",
+                limit=limit,
+                before=before.get("date"),
+                before_id=before.get("vote_id"),
+            )
+            seen.extend(vote["vote_id"] for vote in page["results"])
+            if not page["has_more"]:
+                assert page["next_before"] is None
+                return seen
+            before = page["next_before"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [1, 2, 3, 4])
+    async def test_walk_returns_every_vote_once(self, votes_collection, limit):
+        """Ties on date at a page boundary are neither skipped nor repeated."""
+        seen = await self._walk(limit)
+
+        assert seen == [
+            "h118-1-10",
+            "h118-1-15",
+            "h118-1-14",
+            "h118-1-13",
+            "h118-1-12",
+            "h118-1-11",
+            "h118-1-16",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_next_before_carries_date_and_vote_id(self, votes_collection):
+        """The cursor is the last returned vote's date and vote_id."""
+        page = await VoteService.get_member_votes("A000001", limit=2)
+
+        assert page["has_more"] is True
+        assert page["next_before"] == {"date": "2024-03-01", "vote_id": "h118-1-15"}
+        assert page["total"] == 7
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_returns_empty_page(self, votes_collection):
+        """limit=0 yields no results and no cursor instead of raising."""
+        page = await VoteService.get_member_votes("A000001", limit=0)
+
+        assert page["results"] == []
+        assert page["next_before"] is None
+        assert page["total"] == 7
@@ -0,0 +1,335 @@
+"""
+Unit tests for the sync_votes management command.
+
+Tests the concurrent House detail fetch, the list-page prefetch in
+_sync_chamber_votes, the per-vote UpdateOne ops and their bulk write, and
+the voters backfill against fake API clients and collections.
+"""
+
+import asyncio
+import io
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from votes.management.commands.sync_votes import Command
+
+HOUSE_VOTE = {
+    "houseRollCallVote": {
+        "startDate": "2025-01-03T12:00:00-05:00",
+        "voteQuestion": "On Passage",
+        "result": "Passed",
+    }
+}
+
+HOUSE_VOTE_MEMBERS = {
+    "houseRollCallVoteMemberVotes": {
+        "results": [
+            {
+                "bioguideID": "A000001",
+                "voteCast": "Yea",
+                "voteParty": "D",
+                "voteState": "CA",
+            }
+        ]
+    }
+}
+
+
+class _FakeHouseClient:
+    """Congress API client serving House votes, optionally failing some."""
+
+    def __init__(self, pages=1, page_delay=0, failing_vote=None):
+        self.pages = pages
+        self.page_delay = page_delay
+        self.failing_vote = failing_vote
+        self.page_offsets = []
+        self.members_fetched = []
+        self.cancelled = []
+
+    async def get_house_votes(self, congress, session, limit, offset):
+        self.page_offsets.append(offset)
+        if offset:
+            try:
+                await asyncio.sleep(self.page_delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(offset)
+                raise
+        if offset // limit >= self.pages:
+            return {"houseRollCallVotes": []}
+        return {
+            "houseRollCallVotes": [
+                {"rollCallNumber": offset + i} for i in range(1, limit + 1)
+            ]
+        }
+
+    async def get_house_vote(self, congress, session, roll_number):
+        if roll_number == self.failing_vote:
+            raise RuntimeError("upstream error")
+        return HOUSE_VOTE
+
+    async def get_house_vote_members(self, congress, session, roll_number):
+        await asyncio.sleep(0.01)
+        self.members_fetched.append(roll_number)
+        return HOUSE_VOTE_MEMBERS
+
+
+class _FakeXMLParser:
+    """Senate XML parser returning one parsed vote."""
+
+    def __init__(self, vote_data):
+        self.vote_data = vote_data
+        self.urls = []
+
+    async def fetch_and_parse(self, xml_url):
+        self.urls.append(xml_url)
+        return self.vote_data
+
+
+class _FakeMatcher:
+    """MemberMatcher resolving senators by last name."""
+
+    def __init__(self, by_last_name):
+        self.by_last_name = by_last_name
+
+    async def match_senate_member(self, member_data):
+        return self.by_last_name.get(member_data["last_name"])
+
+
+class _FakeVotesCollection:
+    """Collection recording writes, optionally failing bulk writes."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.writes = []
+        self.ordered = []
+        self.update_many_calls = []
+
+    async def bulk_write(self, ops, ordered=True):
+        if self.error is not None:
+            raise self.error
+        self.writes.append(ops)
+        self.ordered.append(ordered)
+
+    async def update_many(self, query, update):
+        self.update_many_calls.append((query, update))
+        return SimpleNamespace(modified_count=2)
+
+
+@pytest.fixture
+def command():
+    return Command(stdout=io.StringIO())
+
+
+class TestFetchDetailedHouseVote:
+    """Test the concurrent House metadata and member-votes fetch."""
+
+    @pytest.mark.asyncio
+    async def test_combines_metadata_and_members(self, command):
+        """Both responses are merged into one vote with members."""
+        vote = await command._fetch_detailed_vote(
+            _FakeHouseClient(), "house", 119, 1, 7
+        )
+
+        assert vote["voteQuestion"] == "On Passage"
+        assert vote["members"] == [
+            {"bioguideId": "A000001", "vote": "Yea", "party": "D", "state": "CA"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_waits_for_sibling_request(self, command):
+        """A failed metadata fetch returns None without orphaning the other."""
+        client = _FakeHouseClient(failing_vote=7)
+
+        vote = await command._fetch_detailed_vote(client, "house", 119, 1, 7)
+
+        assert vote is None
+        assert client.members_fetched == [7]
+
+
+class TestSyncChamberVotes:
+    """Test batch processing and the next-page prefetch."""
+
+    @pytest.mark.asyncio
+    async def test_failed_vote_is_counted_and_skipped(self, command):
+        """One failing vote is an error; the rest of the batch is stored."""
+        client = _FakeHouseClient(failing_vote=2)
+        collection = _FakeVotesCollection()
+
+        synced, errors = await command._sync_chamber_votes(
+            client, collection, "house", 119, 1, 3
+        )
+
+        assert (synced, errors) == (2, 1)
+        assert len(collection.writes[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_pending_prefetch_cancelled_on_error(self, command):
+        """A batch that fails mid-run doesn't leave the prefetch running."""
+        client = _FakeHouseClient(pages=2, page_delay=10)
+        collection = _FakeVotesCollection(error=RuntimeError("db down"))
+
+        synced, errors = await command._sync_chamber_votes(
+            client, collection, "house", 119, 1, 200
+        )
+
+        assert (synced, errors) == (0, 1)
+        assert client.page_offsets == [0, 100]
+        assert client.cancelled == [100]
+
+
+UPDATED_AT = datetime(2025, 1, 3, 18, 0, tzinfo=timezone.utc)
+
+
+class TestProcessVote:
+    """Test the UpdateOne built for each vote."""
+
+    @pytest.mark.asyncio
+    async def test_house_vote_upsert(self, command):
+        """A House vote becomes one upsert keyed by vote_id with voters."""
+        op = await command._process_vote(
+            asyncio.Semaphore(1),
+            _FakeHouseClient(),
+            "house",
+            119,
+            1,
+            {"rollCallNumber": 7},
+            UPDATED_AT,
+        )
+
+        assert op == UpdateOne(
+            {"vote_id": "h119-1-7"},
+            {
+                "$set": {
+                    "vote_id": "h119-1-7",
+                    "chamber": "house",
+                    "congress": 119,
+                    "session": 1,
+                    "roll_number": 7,
+                    "date": "2025-01-03T12:00:00-05:00",
+                    "question": "On Passage",
+                    "description": None,
+                    "result": "Passed",
+                    "bill_id": None,
+                    "totals": {"yea": 0, "nay": 0, "present": 0, "not_voting": 0},
+                    "member_votes": {"A000001": "Yea"},
+                    "voters": ["A000001"],
+                    "updated_at": UPDATED_AT,
+                }
+            },
+            upsert=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_senate_vote_matches_members(self, command):
+        """Senate XML members are matched to bioguide IDs for voters."""
+        command.xml_parser = _FakeXMLParser(
+            {
+                "vote_date": "2025-01-09T13:45:00-05:00",
+                "vote_question": "On the Nomination",
+                "vote_result": "Confirmed",
+                "totals": {"yea": 1, "nay": 1, "present": 0, "absent": 1},
+                "members": [
+                    {"last_name": "Baldwin", "party": "D", "vote_cast": "Yea"},
+                    {"last_name": "Barrasso", "party": "R", "vote_cast": "Nay"},
+                    {"last_name": "Unknown", "party": "I", "vote_cast": "Not Voting"},
+                ],
+            }
+        )
+        command.matcher = _FakeMatcher({"Baldwin": "B001230", "Barrasso": "B001261"})
+
+        op = await command._process_vote(
+            asyncio.Semaphore(1),
+            None,
+            "senate",
+            119,
+            1,
+            {"rollCallNumber": 3, "sourceDataURL": "https://senate.gov/v3.xml"},
+            UPDATED_AT,
+        )
+
+        stored = op._doc["$set"]
+        assert op._filter == {"vote_id": "s119-1-3"}
+        assert stored["member_votes"] == {"B001230": "Yea", "B001261": "Nay"}
+        assert stored["voters"] == ["B001230", "B001261"]
+        assert stored["totals"] == {"yea": 1, "nay": 1, "present": 0, "not_voting": 1}
+        assert command.xml_parser.urls == ["https://senate.gov/v3.xml"]
+
+    @pytest.mark.asyncio
+    async def test_vote_without_roll_number_skipped(self, command):
+        """List entries without a roll number are skipped, not errors."""
+        result = await command._process_vote(
+            asyncio.Semaphore(1), _FakeHouseClient(), "house", 119, 1, {}, UPDATED_AT
+        )
+
+        assert result is None
+
+
+class TestFlushVotes:
+    """Test the unordered bulk write of a batch."""
+
+    @pytest.mark.asyncio
+    async def test_writes_batch_unordered(self, command):
+        """All ops go to one unordered bulk_write."""
+        collection = _FakeVotesCollection()
+        ops = [UpdateOne({"vote_id": f"h119-1-{n}"}, {"$set": {}}) for n in (1, 2)]
+
+        assert await command._flush_votes(collection, ops) == (2, 0)
+        assert collection.writes == [ops]
+        assert collection.ordered == [False]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_write(self, command):
+        """An empty batch doesn't touch the collection."""
+        collection = _FakeVotesCollection()
+
+        assert await command._flush_votes(collection, []) == (0, 0)
+        assert collection.writes == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_error_counts_failures(self, command):
+        """Reported write errors are failures; the rest were stored."""
+        error = BulkWriteError(
+            {"writeErrors": [{"index": 1, "code": 11000, "errmsg": "dup key"}]}
+        )
+        collection = _FakeVotesCollection(error=error)
+        ops = [UpdateOne({"vote_id": f"h119-1-{n}"}, {"$set": {}}) for n in (1, 2, 3)]
+
+        assert await command._flush_votes(collection, ops) == (2, 1)
+
+
+class TestBackfillVoters:
+    """Test the voters backfill for votes stored before the field existed."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_pipeline(self, command):
+        """Only votes missing voters get member_votes' keys copied over."""
+        collection = _FakeVotesCollection()
+
+        await command._backfill_voters(collection)
+
+        assert collection.update_many_calls == [
+            (
+                {"voters": {"$exists": False}},
+                [
+                    {
+                        "$set": {
+                            "voters": {
+                                "$map": {
+                                    "input": {
+                                        "$objectToArray": {
+                                            "$ifNull": ["$member_votes", {}]
+                                        }
+                                    },
+                                    "in": "$$this.k",
+                                }
+                            }
+                        }
+                    }
+                ],
+            )
+        ]
+        assert command.stdout.getvalue() == "  Backfilled voters on 2 votes\n"
@@ -0,0 +1,343 @@
+"""
+Unit tests for the Senate roll call vote XML parser.
+
+Tests SenateVoteXMLParser.parse_xml and the streaming fetch path against a
+fixture document shaped like the Senate.gov vote XML, and the vote date
+conversion and the on-disk parse cache.
+"""
+
+from datetime import datetime
+
+import httpx
+import pytest
+
+from votes import xml_parser
+from votes.xml_parser import SenateVoteXMLParser
+
+SENATE_VOTE_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<roll_call_vote>
+  <congress>118</congress>
+  <session>2</session>
+  <congress_year>2024</congress_year>
+  <vote_number>5</vote_number>
+  <vote_date>January 8, 2024, 05:27 PM</vote_date>
+  <modify_date>January 8, 2024, 05:45 PM</modify_date>
+  <vote_question_text>On the Cloture Motion S. 4361</vote_question_text>
+  <vote_document_text>A bill making emergency supplemental appropriations</vote_document_text>
+  <vote_result_text>Cloture Motion Agreed to (67-32, 3/5 majority required)</vote_result_text>
+  <question>On the Cloture Motion</question>
+  <vote_title>Motion to Invoke Cloture</vote_title>
+  <majority_requirement>3/5</majority_requirement>
+  <vote_result>Cloture Motion Agreed to</vote_result>
+  <document>
+    <document_congress>118</document_congress>
+    <document_type>S.</document_type>
+    <document_number>4361</document_number>
+    <congress>117</congress>
+    <vote_date>June 1, 2022, 10:00 AM</vote_date>
+  </document>
+  <amendment>
+    <amendment_number></amendment_number>
+    <count><yeas>1</yeas><nays>2</nays></count>
+    <member><last_name>Decoy</last_name></member>
+  </amendment>
+  <count>
+    <yeas>67</yeas>
+    <nays>32</nays>
+    <present></present>
+    <absent>1</absent>
+  </count>
+  <tie_breaker>
+    <by_whom></by_whom>
+    <tie_breaker_vote></tie_breaker_vote>
+  </tie_breaker>
+  <members>
+    <member>
+      <member_full>Baldwin (D-WI)</member_full>
+      <last_name>Baldwin</last_name>
+      <first_name>Tammy</first_name>
+      <party>D</party>
+      <state>WI</state>
+      <vote_cast>Yea</vote_cast>
+      <lis_member_id>S354</lis_member_id>
+    </member>
+    <member>
+      <member_full>Barrasso (R-WY)</member_full>
+      <last_name>Barrasso</last_name>
+      <first_name>John</first_name>
+      <party>R</party>
+      <state>WY</state>
+      <vote_cast>Nay</vote_cast>
+      <lis_member_id>S317</lis_member_id>
+    </member>
+    <member>
+      <member_full>Bennet (D-CO)</member_full>
+      <last_name>Bennet</last_name>
+      <first_name> Michael </first_name>
+      <party>D</party>
+      <state>CO</state>
+      <vote_cast>Not Voting</vote_cast>
+      <lis_member_id>S330</lis_member_id>
+    </member>
+  </members>
+</roll_call_vote>
+"""
+
+EXPECTED_VOTE = {
+    "congress": "118",
+    "session": "2",
+    "vote_number": "5",
+    "vote_date": "2024-01-08T17:27:00-05:00",
+    "vote_question": "On the Cloture Motion S. 4361",
+    "vote_result": "Cloture Motion Agreed to",
+    "vote_result_text": "Cloture Motion Agreed to (67-32, 3/5 majority required)",
+    "vote_document": "A bill making emergency supplemental appropriations",
+    "totals": {"yea": 67, "nay": 32, "present": 0, "absent": 1},
+    "members": [
+        {
+            "first_name": "Tammy",
+            "last_name": "Baldwin",
+            "party": "D",
+            "state": "WI",
+            "vote_cast": "Yea",
+            "lis_member_id": "S354",
+        },
+        {
+            "first_name": "John",
+            "last_name": "Barrasso",
+            "party": "R",
+            "state": "WY",
+            "vote_cast": "Nay",
+            "lis_member_id": "S317",
+        },
+        {
+            "first_name": "Michael",
+            "last_name": "Bennet",
+            "party": "D",
+            "state": "CO",
+            "vote_cast": "Not Voting",
+            "lis_member_id": "S330",
+        },
+    ],
+}
+
+XML_URL = "https://www.senate.gov/legislative/LIS/roll_call_votes/vote1182/vote_118_2_00005.xml"
+
+
+class TestParseXml:
+    """Test parse_xml on a whole document."""
+
+    def test_parses_fixture(self):
+        """Metadata, totals and members come from their expected elements."""
+        assert SenateVoteXMLParser().parse_xml(SENATE_VOTE_XML) == EXPECTED_VOTE
+
+    def test_accepts_str(self):
+        """str input parses the same as the fetched bytes."""
+        parser = SenateVoteXMLParser()
+        assert parser.parse_xml(SENATE_VOTE_XML.decode()) == EXPECTED_VOTE
+
+    def test_ignores_nested_lookalike_elements(self):
+        """Same-named elements outside their expected parent are skipped."""
+        vote_data = SenateVoteXMLParser().parse_xml(SENATE_VOTE_XML)
+
+        # <document><congress>, <amendment><count> and <amendment><member>
+        assert vote_data["congress"] == "118"
+        assert vote_data["totals"]["yea"] == 67
+        assert "Decoy" not in [m["last_name"] for m in vote_data["members"]]
+
+    def test_totals_from_result_text_without_count(self):
+        """Without a root-level <count>, totals come from the result text."""
+        xml = (
+            b"<roll_call_vote>"
+            b"<vote_result_text>Passed (50-49)</vote_result_text>"
+            b"<amendment><count><yeas>9</yeas></count></amendment>"
+            b"</roll_call_vote>"
+        )
+        vote_data = SenateVoteXMLParser().parse_xml(xml)
+
+        assert vote_data["totals"] == {"yea": 50, "nay": 49, "present": 0, "absent": 0}
+
+
+class TestStreamAndParse:
+    """Test that streaming in chunks matches a whole-document parse."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000, len(SENATE_VOTE_XML)])
+    async def test_chunking_does_not_change_result(self, monkeypatch, chunk_size):
+        """Element boundaries split across chunks parse the same."""
+        monkeypatch.setattr(xml_parser, "XML_CHUNK_SIZE", chunk_size)
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=SENATE_VOTE_XML)
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            parser = SenateVoteXMLParser(client=client)
+            vote_data = await parser.fetch_and_parse(XML_URL)
+
+        assert vote_data == EXPECTED_VOTE
+
+    @pytest.mark.asyncio
+    async def test_missing_file_returns_none(self):
+        """A 404 from senate.gov is reported as no data, not an error."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            parser = SenateVoteXMLParser(client=client)
+            assert await parser.fetch_and_parse(XML_URL) is None
+
+    @pytest.mark.asyncio
+    async def test_malformed_xml_returns_none(self):
+        """A truncated document is reported as no data."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=SENATE_VOTE_XML[:-40])
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            parser = SenateVoteXMLParser(client=client)
+            assert await parser.fetch_and_parse(XML_URL) is None
+
+
+def _baseline_parse_date(date_str):
+    """The strptime-only conversion the fast path must reproduce."""
+    if not date_str:
+        return None
+    try:
+        dt = datetime.strptime(date_str, "%B %d, %Y, %I:%M %p")
+        return dt.strftime("%Y-%m-%dT%H:%M:%S-05:00")
+    except ValueError:
+        return date_str
+
+
+class TestParseDate:
+    """Test Senate vote date conversion to ISO format."""
+
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("January 8, 2024, 05:27 PM", "2024-01-08T17:27:00-05:00"),
+            ("December 19, 2023, 10:04 AM", "2023-12-19T10:04:00-05:00"),
+            ("March 1, 2024, 9:05 AM", "2024-03-01T09:05:00-05:00"),
+            ("March 01, 2024, 09:05 AM", "2024-03-01T09:05:00-05:00"),
+            ("July 4, 2024, 12:00 AM", "2024-07-04T00:00:00-05:00"),
+            ("July 4, 2024, 12:30 PM", "2024-07-04T12:30:00-05:00"),
+            ("February 29, 2024, 11:59 PM", "2024-02-29T23:59:00-05:00"),
+        ],
+    )
+    def test_converts_senate_dates(self, date_str, expected):
+        """Usual shapes, single-digit days/hours and 12 AM/PM convert."""
+        assert SenateVoteXMLParser()._parse_date(date_str) == expected
+
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            "Bad date",
+            "January 8, 2024",
+            "Janvier 8, 2024, 05:27 PM",
+            "February 30, 2024, 05:27 PM",
+            "January 8, 2024, 13:27 PM",
+            "January 8, 2024, 00:27 AM",
+            "January 8, 2024, 05:61 PM",
+            "January 8 2024, 05:27 PM",
+        ],
+    )
+    def test_malformed_dates_returned_unchanged(self, date_str):
+        """Dates that can't be parsed are passed through as-is."""
+        assert SenateVoteXMLParser()._parse_date(date_str) == date_str
+
+    def test_empty_date_is_none(self):
+        """A missing <vote_date> becomes None."""
+        assert SenateVoteXMLParser()._parse_date("") is None
+
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            "January 8, 2024, 05:27 PM",
+            "March 1, 2024, 9:05 AM",
+            "July 4, 2024, 12:00 AM",
+            "July 4, 2024, 12:30 PM",
+            "September 30, 2023, 1:00 AM",
+            "January 8, 2024, 05:27 pm",
+            "January 8, 2024,  05:27 PM",
+            "January  8, 2024, 05:27 PM",
+            "February 30, 2024, 05:27 PM",
+            "Bad date",
+            "",
+        ],
+    )
+    def test_matches_strptime_baseline(self, date_str):
+        """The fast path agrees with plain strptime, lenient shapes included."""
+        parser = SenateVoteXMLParser()
+        assert parser._parse_date(date_str) == _baseline_parse_date(date_str)
+
+
+class TestDiskCache:
+    """Test the on-disk cache of parsed vote XML."""
+
+    @pytest.fixture
+    def senate_gov(self):
+        """Mock transport serving the fixture and counting requests."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(200, content=SENATE_VOTE_XML)
+
+        return httpx.MockTransport(handler), requests
+
+    @pytest.mark.asyncio
+    async def test_round_trip_skips_download(self, tmp_path, senate_gov):
+        """A cached parse is read back equal, without a second request."""
+        transport, requests = senate_gov
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await SenateVoteXMLParser(
+                client=client, cache_dir=tmp_path
+            ).fetch_and_parse(XML_URL)
+            second = await SenateVoteXMLParser(
+                client=client, cache_dir=tmp_path
+            ).fetch_and_parse(XML_URL)
+
+        assert first == second == EXPECTED_VOTE
+        assert len(requests) == 1
+        assert list(tmp_path.glob("*/*.tmp")) == []
+
+    @pytest.mark.asyncio
+    async def test_corrupt_file_is_refetched_and_rewritten(self, tmp_path, senate_gov):
+        """An unreadable entry is ignored, then replaced by a fresh parse."""
+        transport, requests = senate_gov
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            parser = SenateVoteXMLParser(client=client, cache_dir=tmp_path)
+            parser._cache_path(XML_URL).parent.mkdir(parents=True)
+            parser._cache_path(XML_URL).write_bytes(b'{"congress": "11')
+
+            assert await parser.fetch_and_parse(XML_URL) == EXPECTED_VOTE
+            assert await parser.fetch_and_parse(XML_URL) == EXPECTED_VOTE
+
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_version_bump_invalidates(self, tmp_path, senate_gov, monkeypatch):
+        """Entries written under another cache version are not read."""
+        transport, requests = senate_gov
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            parser = SenateVoteXMLParser(client=client, cache_dir=tmp_path)
+            await parser.fetch_and_parse(XML_URL)
+            monkeypatch.setattr(
+                xml_parser, "XML_CACHE_VERSION", xml_parser.XML_CACHE_VERSION + 1
+            )
+            await parser.fetch_and_parse(XML_URL)
+
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self, tmp_path):
+        """Missing files are retried on the next run, not cached as None."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            parser = SenateVoteXMLParser(client=client, cache_dir=tmp_path)
+            assert await parser.fetch_and_parse(XML_URL) is None
+
+        assert list(tmp_path.rglob("*.json")) == []
@@ -7,10 +7,15 @@ import logging
 from django.http import JsonResponse
 from django.views import View
 
+from members.views import _parse_int
 from votes.services import VoteService
 
 logger = logging.getLogger(__name__)
 
+# Bounds for member voting record pagination
+MAX_MEMBER_VOTES_LIMIT = 100
+MAX_MEMBER_VOTES_OFFSET = 100_000
+
 
 class VoteListView(View):
     """
@@ -75,8 +80,12 @@ class MemberVotesView(View):
         try:
             chamber = request.GET.get("chamber")
             congress = int(request.GET.get("congress", 118))
-            limit = int(request.GET.get("limit", 20))
-            offset = int(request.GET.get("offset", 0))
+            limit = _parse_int(request.GET.get("limit"), 20, 1, MAX_MEMBER_VOTES_LIMIT)
+            offset = _parse_int(
+                request.GET.get("offset"), 0, 0, MAX_MEMBER_VOTES_OFFSET
+            )
+            before = request.GET.get("before")
+            before_id = request.GET.get("before_id")
 
             result = await VoteService.get_member_votes(
                 bioguide_id=bioguide_id,
@@ -84,6 +93,8 @@ class MemberVotesView(View):
                 congress=congress,
                 limit=limit,
                 offset=offset,
+                before=before,
+                before_id=before_id,
             )
 
             return JsonResponse(result)
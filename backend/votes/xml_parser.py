@@ -4,21 +4,132 @@ XML parser for Senate roll call votes.
 Senate votes are only available as XML from Senate.gov, not via Congress.gov JSON API.
 """
 
+import asyncio
+import hashlib
+import io
 import logging
+import os
+import re
+import sys
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import httpx
+import msgspec
 
 logger = logging.getLogger(__name__)
 
+# "(yeas-nays)" in result text, e.g. "Cloture Motion Agreed to (73-15)"
+TOTALS_FROM_RESULT_RE = re.compile(r"\((\d+)-(\d+)\)")
+
+# <member> child elements kept per member record (also its dict keys)
+MEMBER_TAGS = (
+    "first_name",
+    "last_name",
+    "party",
+    "state",
+    "vote_cast",
+    "lis_member_id",
+)
+
+# (totals key, <count> child element) pairs
+COUNT_FIELDS = (
+    ("yea", "yeas"),
+    ("nay", "nays"),
+    ("present", "present"),
+    ("absent", "absent"),
+)
+
+# Low-cardinality member fields (a few parties/positions, 50 states) shared
+# as one string object each across every parsed vote
+INTERNED_MEMBER_TAGS = ("party", "state", "vote_cast")
+
+# English month names as written in Senate vote dates
+SENATE_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ),
+        start=1,
+    )
+}
+
+# Bytes read from the response per parser feed
+XML_CHUNK_SIZE = 64 * 1024
+
+# Layout version of the on-disk parse cache; bump it whenever parse output
+# changes, so results cached by an older parser are no longer read
+XML_CACHE_VERSION = 2
+
+# Stand-in parent tag for children of the document root
+ROOT_PARENT = ""
+
+# Child handlers of elements whose children are all skipped
+NO_HANDLERS = {}
+
+# Top-level vote metadata: XML tag -> vote_data key
+SCALAR_FIELDS = {
+    "congress": "congress",
+    "session": "session",
+    "vote_number": "vote_number",
+    "vote_date": "vote_date",
+    "vote_question_text": "vote_question",
+    "vote_result": "vote_result",
+    "vote_result_text": "vote_result_text",
+    "vote_document_text": "vote_document",
+}
+
 
 class SenateVoteXMLParser:
-    """Parse Senate roll call vote XML files."""
+    """
+    Parse Senate roll call vote XML files.
+
+    Connections to senate.gov are pooled and kept alive across fetches:
+    pass a shared httpx.AsyncClient (closed by its owner), or let the parser
+    create one on first fetch and release it with aclose().
 
-    def __init__(self, timeout: float = 30.0):
+    Senate vote XML files don't change once published, so with a cache_dir
+    each URL's parsed result is stored on disk and later runs (e.g. a
+    re-run backfill) skip both the download and the parse. Entries never
+    expire: they are kept under an XML_CACHE_VERSION subdirectory, and
+    deleting the directory (or bumping the version) invalidates them.
+    Unreadable entries are ignored and rewritten on the next fetch.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
+        cache_dir: Optional[str | Path] = None,
+    ):
         self.timeout = timeout
+        self.client = client
+        self._owns_client = False
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Element end-event dispatch: parent tag -> {tag: handler}, where
+        # ROOT_PARENT stands for the document root whatever its tag, so
+        # same-named elements nested elsewhere are ignored
+        self._handlers = {
+            ROOT_PARENT: {
+                "count": self._read_count,
+                **{tag: self._read_scalar for tag in SCALAR_FIELDS},
+            },
+            "members": {"member": self._read_member},
+        }
 
     async def fetch_and_parse(self, xml_url: str) -> Optional[dict]:
         """
@@ -28,82 +139,206 @@ class SenateVoteXMLParser:
             xml_url: URL to the Senate vote XML file
 
         Returns:
-            Parsed vote data dict, or None if error
+            Parsed vote data dict, or None if the file couldn't be fetched
+            or isn't well-formed XML. Other exceptions (bugs) propagate.
         """
+        cached = self._read_cache(xml_url)
+        if cached is not None:
+            return cached
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(xml_url)
-                response.raise_for_status()
-                xml_content = response.text
+            vote_data = await self._stream_and_parse(self._get_client(), xml_url)
+        except httpx.HTTPStatusError as e:
+            if e.response.is_client_error:
+                # Missing/forbidden vote file: permanent, retrying won't help
+                logger.warning("Senate XML not available at %s: %s", xml_url, e)
+            else:
+                logger.error("Error fetching Senate XML from %s: %s", xml_url, e)
+            return None
+        except httpx.HTTPError as e:
+            # Timeouts and connection failures: transient
+            logger.error("Error fetching Senate XML from %s: %s", xml_url, e)
+            return None
+        except ET.ParseError as e:
+            logger.error("Malformed Senate XML from %s: %s", xml_url, e)
+            return None
 
-            return self.parse_xml(xml_content)
+        self._write_cache(xml_url, vote_data)
+        return vote_data
 
-        except Exception as e:
-            logger.error(f"Error fetching/parsing Senate XML from {xml_url}: {e}")
+    def _cache_path(self, xml_url: str) -> Optional[Path]:
+        """On-disk cache file for a URL, or None when caching is off."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(xml_url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"v{XML_CACHE_VERSION}" / f"{digest}.json"
+
+    def _read_cache(self, xml_url: str) -> Optional[dict]:
+        """Return the cached parse of a URL, if any."""
+        path = self._cache_path(xml_url)
+        if path is None:
+            return None
+        try:
+            return msgspec.json.decode(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, msgspec.DecodeError) as e:
+            logger.warning("Ignoring unreadable Senate XML cache %s: %s", path, e)
             return None
 
-    def parse_xml(self, xml_content: str) -> dict:
+    def _write_cache(self, xml_url: str, vote_data: dict):
+        """Store a parse result; cache failures never fail the fetch."""
+        path = self._cache_path(xml_url)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(msgspec.json.encode(vote_data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write Senate XML cache %s: %s", path, e)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating a pooled one on first use."""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+            self._owns_client = True
+        return self.client
+
+    async def aclose(self):
+        """Close the HTTP client if this parser created it."""
+        if self._owns_client:
+            await self.client.aclose()
+            self.client = None
+            self._owns_client = False
+
+    async def _stream_and_parse(self, client: httpx.AsyncClient, xml_url: str) -> dict:
+        """
+        Stream the response body into an incremental XML parser.
+
+        Parsing starts with the first chunk instead of after the whole body
+        has arrived, and the raw XML is never held in memory at once.
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        vote_data = self._new_vote_data()
+        open_handlers = []
+
+        async with client.stream("GET", xml_url, timeout=self.timeout) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(XML_CHUNK_SIZE):
+                # Parsing a full roll call takes ~1ms of CPU; run it in a
+                # worker thread so concurrent fetches keep being serviced
+                await asyncio.to_thread(
+                    self._feed, parser, chunk, vote_data, open_handlers
+                )
+
+        parser.close()
+        self._dispatch(parser.read_events(), vote_data, open_handlers)
+        return self._finish(vote_data)
+
+    def parse_xml(self, xml_content: str | bytes) -> dict:
         """
         Parse Senate vote XML content.
 
+        The document is read in a single iterparse pass: each element's end
+        event is dispatched on its tag and its parent's tag to pick up
+        metadata, totals and member records, and each <member> element is
+        cleared once read, so no DOM is kept alongside the extracted dicts.
+
         Args:
-            xml_content: Raw XML string
+            xml_content: Raw XML (bytes as fetched, or str)
 
         Returns:
             Dict with vote metadata and member votes
         """
-        root = ET.fromstring(xml_content)
-
-        # Extract vote metadata
-        vote_data = {
-            "congress": self._get_text(root, "congress"),
-            "session": self._get_text(root, "session"),
-            "vote_number": self._get_text(root, "vote_number"),
-            "vote_date": self._parse_date(self._get_text(root, "vote_date")),
-            "vote_question": self._get_text(root, "vote_question_text"),
-            "vote_result": self._get_text(root, "vote_result"),
-            "vote_result_text": self._get_text(root, "vote_result_text"),
-            "vote_document": self._get_text(root, "vote_document_text"),
-        }
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
 
-        # Extract member votes
-        members = []
-        for member_elem in root.findall(".//member"):
-            member = {
-                "first_name": self._get_text(member_elem, "first_name"),
-                "last_name": self._get_text(member_elem, "last_name"),
-                "party": self._get_text(member_elem, "party"),
-                "state": self._get_text(member_elem, "state"),
-                "vote_cast": self._get_text(member_elem, "vote_cast"),
-                "lis_member_id": self._get_text(member_elem, "lis_member_id"),
-            }
-            members.append(member)
-
-        vote_data["members"] = members
-
-        # Extract totals from count section
-        count_elem = root.find(".//count")
-        if count_elem is not None:
-            vote_data["totals"] = {
-                "yea": int(self._get_text(count_elem, "yeas", "0")),
-                "nay": int(self._get_text(count_elem, "nays", "0")),
-                "present": int(self._get_text(count_elem, "present", "0")),
-                "absent": int(self._get_text(count_elem, "absent", "0")),
-            }
-        else:
-            # Parse from vote_result_text (e.g., "Agreed to (73-15)")
+        vote_data = self._new_vote_data()
+        self._dispatch(
+            ET.iterparse(io.BytesIO(xml_content), events=("start", "end")),
+            vote_data,
+            [],
+        )
+        return self._finish(vote_data)
+
+    def _new_vote_data(self) -> dict:
+        """Empty vote_data filled in by the element handlers."""
+        vote_data = dict.fromkeys(SCALAR_FIELDS.values(), "")
+        vote_data["members"] = []
+        return vote_data
+
+    def _feed(
+        self,
+        parser: ET.XMLPullParser,
+        chunk: bytes,
+        vote_data: dict,
+        open_handlers: list,
+    ):
+        """Feed one chunk of XML and handle the elements it completes."""
+        parser.feed(chunk)
+        self._dispatch(parser.read_events(), vote_data, open_handlers)
+
+    def _dispatch(self, events, vote_data: dict, open_handlers: list):
+        """
+        Hand each completed element to the handler for its tag under its
+        parent.
+
+        open_handlers holds, per currently open element, the handlers for
+        that element's children; it carries over between the chunks of one
+        document.
+        """
+        handlers = self._handlers
+        push = open_handlers.append
+        pop = open_handlers.pop
+        for event, elem in events:
+            if event == "start":
+                parent = elem.tag if open_handlers else ROOT_PARENT
+                push(handlers.get(parent, NO_HANDLERS))
+                continue
+            pop()
+            if open_handlers:
+                handler = open_handlers[-1].get(elem.tag)
+                if handler is not None:
+                    handler(elem, vote_data)
+
+    def _finish(self, vote_data: dict) -> dict:
+        """Post-process fields that need the whole document."""
+        vote_data["vote_date"] = self._parse_date(vote_data["vote_date"])
+
+        if "totals" not in vote_data:
+            # No count section; parse from vote_result_text
+            # (e.g., "Agreed to (73-15)")
             vote_data["totals"] = self._parse_totals_from_result(
-                vote_data.get("vote_result_text", "")
+                vote_data["vote_result_text"]
             )
 
         return vote_data
 
-    def _get_text(self, element: ET.Element, tag: str, default: str = "") -> str:
-        """Get text content from XML element."""
-        child = element.find(tag)
-        if child is not None and child.text:
-            return child.text.strip()
-        return default
+    def _read_scalar(self, elem: ET.Element, vote_data: dict):
+        """Store a top-level metadata element's text."""
+        vote_data[SCALAR_FIELDS[elem.tag]] = (elem.text or "").strip()
+
+    def _read_count(self, elem: ET.Element, vote_data: dict):
+        """Store vote totals from the <count> section."""
+        findtext = elem.findtext
+        vote_data["totals"] = {
+            key: int((findtext(tag) or "").strip() or 0) for key, tag in COUNT_FIELDS
+        }
+
+    def _read_member(self, elem: ET.Element, vote_data: dict):
+        """Append a <member> record, then free the element's children."""
+        findtext = elem.findtext
+        member = {tag: (findtext(tag) or "").strip() for tag in MEMBER_TAGS}
+        for tag in INTERNED_MEMBER_TAGS:
+            member[tag] = sys.intern(member[tag])
+        vote_data["members"].append(member)
+        elem.clear()
 
     def _parse_date(self, date_str: str) -> Optional[str]:
         """
@@ -114,13 +349,46 @@ class SenateVoteXMLParser:
         if not date_str:
             return None
 
+        # Fast path for the usual "Month D, YYYY, HH:MM AM" shape; anything
+        # else goes through strptime below
+        try:
+            month_day, year, clock = date_str.split(", ")
+            month_name, day = month_day.split(" ")
+            hour_minute, meridiem = clock.split(" ")
+            hour, minute = hour_minute.split(":")
+            if (
+                meridiem in ("AM", "PM")
+                and len(year) == 4
+                and len(minute) == 2
+                and len(day) <= 2
+                and len(hour) <= 2
+                and (day + year + hour + minute).isdigit()
+                and (day + year + hour + minute).isascii()
+            ):
+                hour = int(hour)
+                if 1 <= hour <= 12:
+                    # Validates day-of-month and minute ranges
+                    dt = datetime(
+                        int(year),
+                        SENATE_MONTHS[month_name],
+                        int(day),
+                        hour % 12 + (12 if meridiem == "PM" else 0),
+                        int(minute),
+                    )
+                    return (
+                        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+                        f"T{dt.hour:02d}:{dt.minute:02d}:00-05:00"
+                    )
+        except (KeyError, ValueError):
+            pass
+
         try:
             # Parse the date
             dt = datetime.strptime(date_str, "%B %d, %Y, %I:%M %p")
             # Return ISO format with timezone (Senate is in Eastern Time)
             return dt.strftime("%Y-%m-%dT%H:%M:%S-05:00")
         except ValueError:
-            logger.warning(f"Could not parse Senate date: {date_str}")
+            logger.warning("Could not parse Senate date: %s", date_str)
             return date_str
 
     def _parse_totals_from_result(self, result_text: str) -> dict:
@@ -129,14 +397,14 @@ class SenateVoteXMLParser:
 
         Example: "Cloture Motion Agreed to (73-15)"
         """
-        totals = {"yea": 0, "nay": 0, "present": 0, "absent": 0}
-
         # Try to extract numbers from parentheses
-        import re
-
-        match = re.search(r"\((\d+)-(\d+)\)", result_text)
+        match = TOTALS_FROM_RESULT_RE.search(result_text)
         if match:
-            totals["yea"] = int(match.group(1))
-            totals["nay"] = int(match.group(2))
+            return {
+                "yea": int(match[1]),
+                "nay": int(match[2]),
+                "present": 0,
+                "absent": 0,
+            }
 
-        return totals
+        return {"yea": 0, "nay": 0, "present": 0, "absent": 0}
@@ -13,7 +13,7 @@ export interface Member {
   phone?: string
   address?: string
   terms?: Term[]
-  updated_at?: string
+  updated_at?: number  // epoch seconds (UTC)
 }
 
 export interface MemberSummary {